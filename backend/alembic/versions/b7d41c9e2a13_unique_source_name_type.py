@@ -0,0 +1,39 @@
+"""Unique source name per type
+
+Revision ID: b7d41c9e2a13
+Revises: 545fe12e5059
+Create Date: 2025-05-20 10:12:44.318205
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'b7d41c9e2a13'
+down_revision = '545fe12e5059'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Fold any duplicate sources into the oldest row before adding the constraint
+    op.execute('''
+        UPDATE article a
+        SET source_id = keep.id
+        FROM source s
+        JOIN (
+            SELECT name, type, MIN(id) AS id FROM source GROUP BY name, type
+        ) keep ON keep.name = s.name AND keep.type = s.type
+        WHERE a.source_id = s.id AND s.id <> keep.id;
+    ''')
+    op.execute('''
+        DELETE FROM source s
+        USING source keep
+        WHERE s.name = keep.name AND s.type = keep.type AND s.id > keep.id;
+    ''')
+
+    op.create_unique_constraint(
+        'unique_source_name_type', 'source', ['name', 'type'])
+
+
+def downgrade():
+    op.drop_constraint('unique_source_name_type', 'source', type_='unique')
@@ -0,0 +1,43 @@
+"""Add normalized article URL for deduplication
+
+Revision ID: c2e8a5f31d07
+Revises: b7d41c9e2a13
+Create Date: 2025-05-21 09:41:07.552913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c2e8a5f31d07'
+down_revision = 'b7d41c9e2a13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('article', sa.Column(
+        'url_normalized', sa.String(length=2048), nullable=True))
+
+    # Backfill, leaving NULL on all but the oldest of any rows that
+    # normalize to the same URL so the unique constraint can be added
+    op.execute('''
+        UPDATE article a
+        SET url_normalized = d.norm
+        FROM (
+            SELECT id, lower(rtrim(url, '/')) AS norm,
+                   row_number() OVER (
+                       PARTITION BY lower(rtrim(url, '/')) ORDER BY id) AS rn
+            FROM article
+        ) d
+        WHERE a.id = d.id AND d.rn = 1;
+    ''')
+
+    op.create_unique_constraint(
+        'unique_article_url_normalized', 'article', ['url_normalized'])
+
+
+def downgrade():
+    op.drop_constraint('unique_article_url_normalized',
+                       'article', type_='unique')
+    op.drop_column('article', 'url_normalized')
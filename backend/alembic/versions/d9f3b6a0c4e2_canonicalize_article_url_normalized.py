@@ -0,0 +1,62 @@
+"""Recompute normalized article URLs with host-level canonicalization
+
+Revision ID: d9f3b6a0c4e2
+Revises: c2e8a5f31d07
+Create Date: 2025-05-22 14:03:51.207394
+
+"""
+from urllib.parse import urlsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd9f3b6a0c4e2'
+down_revision = 'c2e8a5f31d07'
+branch_labels = None
+depends_on = None
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def _canonical_url(url):
+    # Snapshot of app.db.models.normalize_url at this revision
+    parts = urlsplit(url.strip())
+    host = parts.hostname or ''
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    path = parts.path.rstrip('/')
+    query = f"?{parts.query}" if parts.query else ''
+    return f"{host}{path}{query}" if host else f"{path}{query}"
+
+
+def _rewrite(normalize):
+    bind = op.get_bind()
+    rows = bind.execute(sa.text('SELECT id, url FROM article ORDER BY id')).fetchall()
+
+    # Clear first so rows can be reassigned without tripping the constraint;
+    # only the oldest row of any colliding set keeps a value
+    bind.execute(sa.text('UPDATE article SET url_normalized = NULL'))
+    seen = set()
+    updates = []
+    for row in rows:
+        normalized = normalize(row.url)
+        if normalized not in seen:
+            seen.add(normalized)
+            updates.append({'id': row.id, 'url_normalized': normalized})
+
+    if updates:
+        bind.execute(sa.text(
+            'UPDATE article SET url_normalized = :url_normalized WHERE id = :id'), updates)
+
+
+def upgrade():
+    _rewrite(_canonical_url)
+
+
+def downgrade():
+    _rewrite(lambda url: url.lower().rstrip('/'))
@@ -0,0 +1,30 @@
+"""Store article embeddings as halfvec
+
+Revision ID: e4a7c1b8f925
+Revises: d9f3b6a0c4e2
+Create Date: 2025-05-23 14:12:36.204817
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e4a7c1b8f925'
+down_revision = 'd9f3b6a0c4e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('''
+        ALTER TABLE article
+        ALTER COLUMN embedding TYPE halfvec(3072)
+        USING embedding::halfvec(3072);
+    ''')
+
+
+def downgrade():
+    op.execute('''
+        ALTER TABLE article
+        ALTER COLUMN embedding TYPE vector(3072)
+        USING embedding::vector(3072);
+    ''')
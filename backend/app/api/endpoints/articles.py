@@ -1,6 +1,6 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import func, desc
 import random  # For generating demo images
 import json
@@ -13,7 +13,7 @@ from app.api.deps import get_db
 from app.pipeline.processor import ArticleProcessor
 from app.workers.tasks import fetch_all_articles, update_all_relevance_scores, batch_score_articles_async
 from app.db.utils import get_articles_timestamp, update_articles_timestamp
-from app.core.redis import get_redis_client
+from app.core.redis import get_redis_client, clear_feed_cache
 
 
 # Configure logger
@@ -243,6 +243,19 @@ def trigger_update_scores():
     }
 
 
+@router.post("/clear-feed-cache", response_model=dict)
+def trigger_clear_feed_cache():
+    """
+    Invalidate cached upstream feed responses so the next fetch hits the sources
+    """
+    cleared = clear_feed_cache()
+
+    return {
+        "message": "Feed cache cleared successfully",
+        "cleared_keys": cleared
+    }
+
+
 # This endpoint is no longer actively used. The application now uses the batch async
 # endpoints (batch-score-async and batch-score-status) for personalization instead.
 @router.post("/", response_model=dict)
@@ -291,6 +304,12 @@ def get_articles_with_persona(
             # Basic query for this industry
             industry_query = db.query(Article).filter(Article.industry == ind)
 
+            # The embedding pre-rank reads every article's vector, so load
+            # them with the rows rather than one lazy query per article
+            if persona and use_llm:
+                industry_query = industry_query.options(
+                    undefer(Article.embedding))
+
             # Apply sorting (but we'll re-sort later if persona is provided)
             if sort_order == "desc":
                 industry_query = industry_query.order_by(
@@ -308,11 +327,10 @@ def get_articles_with_persona(
         if persona:
             # If using LLM scoring, we want to be efficient about it
             if use_llm:
-                # First pass: use lightweight method for all articles
-                for article in articles:
-                    # Pre-rank with keyword matching (fast)
-                    article.relevance_score = processor._calculate_persona_relevance_fallback(
-                        article, persona)
+                # First pass: pre-rank all articles by embedding similarity (fast)
+                for article, score in zip(articles, processor._calculate_persona_similarity_batch(
+                        articles, persona)):
+                    article.relevance_score = score
 
                 # Sort based on initial scores
                 articles.sort(key=lambda a: a.relevance_score, reverse=True)
@@ -320,13 +338,17 @@ def get_articles_with_persona(
                 # Second pass: use LLM only for the top candidates (limit * 1.5)
                 # This ensures we get the most relevant articles with full LLM scoring
                 llm_scoring_limit = min(len(articles), int(limit * 1.5))
-                for i in range(llm_scoring_limit):
-                    articles[i].relevance_score = processor.calculate_combined_relevance_score(
-                        articles[i], persona)
-
-                # Final sort based on LLM-enhanced scores
-                articles.sort(key=lambda a: a.relevance_score,
-                              reverse=(sort_order == "desc"))
+                candidates = articles[:llm_scoring_limit]
+                for article, score in zip(candidates, processor.calculate_combined_relevance_scores_batch(
+                        candidates, persona)):
+                    article.relevance_score = score
+
+                # Final sort of the LLM-scored candidates only; similarity
+                # scores are on a different scale, so the rest follow below
+                # in their pre-rank order
+                candidates.sort(key=lambda a: a.relevance_score,
+                                reverse=(sort_order == "desc"))
+                articles = candidates + articles[llm_scoring_limit:]
             else:
                 # Use simpler scoring for all articles
                 for article in articles:
@@ -354,6 +376,10 @@ def get_articles_with_persona(
             # Reasonable cap to avoid performance issues
             expanded_limit = min(500, limit * 3)
 
+            # Load embeddings with the rows for the similarity pre-rank
+            if use_llm:
+                query = query.options(undefer(Article.embedding))
+
             # Apply basic sorting for initial fetch
             if sort_order == "desc":
                 query = query.order_by(desc(getattr(Article, sort_by)))
@@ -366,25 +392,27 @@ def get_articles_with_persona(
 
             # If using LLM, apply the two-pass optimization
             if use_llm and persona:
-                # First pass: calculate baseline scores
-                for article in expanded_articles:
-                    article.relevance_score = processor._calculate_persona_relevance_fallback(
-                        article, persona)
+                # First pass: calculate baseline scores by embedding similarity
+                for article, score in zip(expanded_articles, processor._calculate_persona_similarity_batch(
+                        expanded_articles, persona)):
+                    article.relevance_score = score
 
                 # Sort by baseline scores
                 expanded_articles.sort(
                     key=lambda a: a.relevance_score, reverse=True)
 
                 # Second pass: apply LLM scoring to top candidates
-                llm_candidates = min(len(expanded_articles), limit * 2)
-                for i in range(llm_candidates):
-                    expanded_articles[i].relevance_score = processor.calculate_combined_relevance_score(
-                        expanded_articles[i], persona
-                    )
-
-                # Final sort with LLM-enhanced scores
-                expanded_articles.sort(
+                llm_candidates = expanded_articles[:limit * 2]
+                for article, score in zip(llm_candidates, processor.calculate_combined_relevance_scores_batch(
+                        llm_candidates, persona)):
+                    article.relevance_score = score
+
+                # Final sort of the LLM-scored candidates, with the rest kept
+                # below them in pre-rank order
+                llm_candidates.sort(
                     key=lambda a: a.relevance_score, reverse=(sort_order == "desc"))
+                expanded_articles = llm_candidates + \
+                    expanded_articles[limit * 2:]
             else:
                 # Recalculate scores with persona using simpler method
                 for article in expanded_articles:
@@ -2,9 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
-import openai
 import logging
 from app.core.config import settings
+from app.core.openai_client import get_openai_client
 from app.db.session import get_db
 from sqlalchemy.orm import Session
 import time
@@ -68,8 +68,8 @@ async def generate_message(
         if cache_key in message_cache and not request.regenerate:
             return MessageResponse(message=message_cache[cache_key], cached=True)
 
-        # Initialize OpenAI client
-        client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        # Shared OpenAI client with a pooled HTTP/2 connection
+        client = get_openai_client()
 
         # Construct the prompt based on platform and persona
         prompt = construct_prompt(
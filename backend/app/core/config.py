@@ -42,6 +42,14 @@ class Settings(BaseSettings):
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-large"
     # Dimensions for text-embedding-3-large
     OPENAI_EMBEDDING_DIMENSIONS: int = 3072
+    # Upper bound on in-flight OpenAI requests when fanning out with asyncio
+    OPENAI_MAX_CONCURRENCY: int = 20
+    # Completion requests per minute each event loop may start, kept under
+    # the account's RPM limit instead of relying on 429 retries; 0 disables
+    OPENAI_REQUESTS_PER_MINUTE: int = 0
+    # Ask the model for an article's industry when the keyword heuristic
+    # finds none; False leaves those articles as "other"
+    LLM_INDUSTRY_FALLBACK: bool = True
 
     # NewsAPI
     NEWSAPI_KEY: str
@@ -0,0 +1,45 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout applied to every outbound feed request
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Upstream statuses worth retrying with backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Headers sent with every outbound feed request; compressed bodies are
+# several times smaller for large JSON/XML responses
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': 'PulsePickAI/0.1'
+}
+
+# HTTP session singleton
+_http_session = None
+
+
+def get_http_session():
+    """
+    Returns a shared requests session.
+    Uses a singleton pattern so connectors reuse pooled connections
+    instead of paying a TCP + TLS handshake on every request.
+    Transient upstream failures are retried with exponential backoff.
+    """
+    global _http_session
+
+    if _http_session is None:
+        _http_session = requests.Session()
+        _http_session.headers.update(DEFAULT_HEADERS)
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=retries)
+        _http_session.mount("https://", adapter)
+        _http_session.mount("http://", adapter)
+
+    return _http_session
@@ -0,0 +1,104 @@
+import asyncio
+import weakref
+
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
+
+from app.core.config import settings
+
+# Connection pool shared by OpenAI requests; HTTP/2 multiplexes concurrent
+# calls over a few warm connections instead of a TLS handshake per request
+OPENAI_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=100, max_connections=100)
+OPENAI_HTTP_TIMEOUT = 60.0
+
+# OpenAI client singleton
+_openai_client = None
+
+# One async client per event loop, dropped along with the loop
+_async_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+class RequestRateLimiter:
+    """
+    Spaces request starts evenly to stay under a requests-per-minute budget.
+    Only used from one event loop, so the slot bookkeeping needs no lock.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Wait for this request's turn"""
+        if not self._interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+# One rate limiter per event loop, alongside that loop's client
+_openai_rate_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RequestRateLimiter]" = weakref.WeakKeyDictionary()
+
+
+def get_openai_client() -> OpenAI:
+    """
+    Returns a shared OpenAI client.
+    Uses a singleton pattern so every caller reuses the same HTTP/2
+    connection pool. The client is safe to use from several threads at
+    once, so worker threads and processor instances share it as is.
+    """
+    global _openai_client
+
+    if _openai_client is None:
+        _openai_client = OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=DefaultHttpxClient(
+                http2=True, limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT)
+        )
+
+    return _openai_client
+
+
+def create_async_openai_client() -> AsyncOpenAI:
+    """
+    Returns a new AsyncOpenAI client with the same pool settings.
+    Async connections are bound to the event loop that opened them, so
+    this is not shared across asyncio.run() calls.
+    """
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=DefaultAsyncHttpxClient(
+            http2=True, limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT)
+    )
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Returns the AsyncOpenAI client for the running event loop.
+    Every request made inside one asyncio.run() shares a single HTTP/2
+    connection pool, and a later run gets a fresh client instead of one
+    whose connections belong to a closed loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_openai_clients.get(loop)
+    if client is None:
+        client = _async_openai_clients[loop] = create_async_openai_client()
+    return client
+
+
+def get_openai_rate_limiter() -> RequestRateLimiter:
+    """
+    Returns the rate limiter for the running event loop.
+    Every request in one asyncio.run() waits on it before starting, so
+    concurrent fan-out stays under OPENAI_REQUESTS_PER_MINUTE.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _openai_rate_limiters.get(loop)
+    if limiter is None:
+        limiter = _openai_rate_limiters[loop] = RequestRateLimiter(
+            settings.OPENAI_REQUESTS_PER_MINUTE)
+    return limiter
@@ -1,9 +1,18 @@
+import logging
+from typing import Callable, Optional
+
 import redis
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Redis client singleton
 _redis_client = None
 
+# Common prefix for cached upstream feed responses, so they can be
+# invalidated together
+FEED_CACHE_PREFIX = "feed_cache:"
+
 
 def get_redis_client():
     """
@@ -17,3 +26,46 @@ def get_redis_client():
         _redis_client = redis.from_url(redis_url)
 
     return _redis_client
+
+
+def get_cached(key: str) -> Optional[bytes]:
+    """Return the cached value for key, or None on a miss or Redis error"""
+    try:
+        return get_redis_client().get(key)
+    except redis.RedisError as e:
+        logger.warning("Redis cache lookup failed for %s: %s", key, e)
+        return None
+
+
+def set_cached(key: str, ttl: int, value: bytes) -> None:
+    """Cache value under key for ttl seconds, ignoring Redis errors"""
+    try:
+        get_redis_client().setex(key, ttl, value)
+    except redis.RedisError as e:
+        logger.warning("Redis cache write failed for %s: %s", key, e)
+
+
+def cached_get(key: str, ttl: int, fetcher: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+    """
+    Cache-aside lookup: return the cached value for key, otherwise call
+    fetcher and cache its result for ttl seconds. A None result is not cached.
+    """
+    value = get_cached(key)
+    if value is not None:
+        logger.debug("X-Cache: HIT %s", key)
+        return value
+
+    logger.debug("X-Cache: MISS %s", key)
+    value = fetcher()
+    if value is not None:
+        set_cached(key, ttl, value)
+    return value
+
+
+def clear_feed_cache() -> int:
+    """Delete all cached upstream feed responses and return how many were removed"""
+    redis_client = get_redis_client()
+    keys = list(redis_client.scan_iter(match=f"{FEED_CACHE_PREFIX}*"))
+    if keys:
+        redis_client.delete(*keys)
+    return len(keys)
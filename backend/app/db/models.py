@@ -1,14 +1,42 @@
+import math
 from enum import Enum
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Float, DateTime, JSON, UniqueConstraint
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Float, DateTime, JSON, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
-from datetime import datetime
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred, relationship, validates
+from pgvector.sqlalchemy import HALFVEC
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
 from app.db.base_class import Base
 from app.core.config import settings
 
 
+# Ports implied by the scheme, dropped from the canonical host
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonicalize a URL for duplicate detection
+
+    The scheme, default ports, fragment and trailing slashes are dropped and
+    the host is lowercased, so http/https and :80/:443 variants collide.
+    Path and query keep their case, since article IDs are often case-sensitive.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.hostname or ''
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    path = parts.path.rstrip('/')
+    query = f"?{parts.query}" if parts.query else ''
+    return f"{host}{path}{query}" if host else f"{path}{query}"
+
+
 class SourceType(str, Enum):
     GOOGLE_NEWS = "google_news"
     NEWS_API = "news_api"
@@ -33,14 +61,24 @@ class Source(Base):
     # Relationship
     articles = relationship("Article", back_populates="source")
 
+    __table_args__ = (
+        UniqueConstraint('name', 'type', name='unique_source_name_type'),
+    )
+
     def __repr__(self):
         return f"<Source {self.name}>"
 
 
+# How quickly an article's recency score decays per day of age
+RECENCY_DECAY = 0.5
+
+
 class Article(Base):
     source_id = Column(Integer, ForeignKey("source.id"), nullable=False)
     title = Column(String(512), nullable=False)
     url = Column(String(2048), nullable=False, unique=True)
+    # Lookup key for deduplication, kept in sync with url
+    url_normalized = Column(String(2048), nullable=True)
     author = Column(String(255), nullable=True)
     published_at = Column(DateTime, nullable=True)
     summary = Column(Text, nullable=True)
@@ -52,9 +90,10 @@ class Article(Base):
     industry = Column(String(50), nullable=True)
     relevance_score = Column(Float, nullable=True, default=0.0)
 
-    # Vector embedding for similarity search
-    embedding = Column(
-        Vector(settings.OPENAI_EMBEDDING_DIMENSIONS), nullable=True)
+    # Vector embedding for similarity search; deferred so listing queries
+    # don't fetch and decode a 3072-dim vector per row they never read
+    embedding = deferred(Column(
+        HALFVEC(settings.OPENAI_EMBEDDING_DIMENSIONS), nullable=True))
 
     # Relationship
     source = relationship("Source", back_populates="articles")
@@ -62,8 +101,41 @@ class Article(Base):
     # Indices and constraints
     __table_args__ = (
         UniqueConstraint('url', name='unique_article_url'),
+        UniqueConstraint('url_normalized',
+                         name='unique_article_url_normalized'),
     )
 
+    @validates('url')
+    def _sync_url_normalized(self, key, url):
+        self.url_normalized = normalize_url(url) if url else None
+        return url
+
+    def recency_score_at(self, now: datetime) -> float:
+        """recency_score as of a given timezone-aware time"""
+        if self.published_at is None:
+            return 0.0
+        published_at = self.published_at
+        if published_at.tzinfo is None:
+            published_at = published_at.replace(tzinfo=timezone.utc)
+        days_old = (now - published_at).days
+        return math.exp(-RECENCY_DECAY * max(0, days_old))
+
+    @hybrid_property
+    def recency_score(self) -> float:
+        """exp(-RECENCY_DECAY * whole days since publication), 0.0 if undated"""
+        return self.recency_score_at(datetime.now(timezone.utc))
+
+    @recency_score.expression
+    def recency_score(cls):
+        # The migrations (canonical) store published_at as naive UTC, while
+        # init.sql declares it timestamptz. Epoch seconds read a naive value
+        # as UTC and a timestamptz as its instant, so both schemas give the
+        # same age regardless of the session TimeZone
+        days_old = func.floor((func.extract('epoch', func.now()) -
+                               func.extract('epoch', cls.published_at)) / 86400)
+        return func.coalesce(
+            func.exp(-RECENCY_DECAY * func.greatest(days_old, 0)), 0.0)
+
     def __repr__(self):
         return f"<Article {self.title[:30]}...>"
 
@@ -1,9 +1,18 @@
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+def _json_serializer(obj) -> str:
+    """Serialize JSON columns (e.g. Article.raw_json) with orjson"""
+    return orjson.dumps(obj, default=str).decode()
+
+
+engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI),
+                       json_serializer=_json_serializer,
+                       json_deserializer=orjson.loads)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
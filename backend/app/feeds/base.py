@@ -1,11 +1,29 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 
 from app.db.models import Source, Article, SourceType
 
 
+@dataclass(slots=True)
+class ArticleRecord:
+    """A fetched article, before it is handed to the processing pipeline"""
+    source_id: int
+    title: str
+    url: str
+    author: Optional[str]
+    published_at: Optional[datetime]
+    content: Optional[str]
+    raw_json: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict form used at the Celery/database boundary"""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
 class BaseConnector(ABC):
     """Base class for all feed connectors"""
 
@@ -33,6 +51,53 @@ class BaseConnector(ABC):
 
         return source
 
+    def get_or_create_source_ids(self, sources: List[Dict[str, Optional[str]]]) -> Dict[str, int]:
+        """
+        Get or create several sources at once
+
+        Args:
+            sources: List of dicts with a 'name' and optional 'url'/'description'
+
+        Returns:
+            Mapping of source name to source id, resolved with one SELECT and
+            at most one INSERT ... ON CONFLICT instead of a round trip per source
+        """
+        names = [source['name'] for source in sources]
+        source_ids = dict(self.db.query(Source.name, Source.id).filter(
+            Source.name.in_(names),
+            Source.type == self.source_type
+        ).all())
+
+        missing = [
+            {
+                'name': source['name'],
+                'type': self.source_type,
+                'url': source.get('url'),
+                'description': source.get('description')
+            }
+            for source in sources if source['name'] not in source_ids
+        ]
+
+        if missing:
+            # Concurrent workers may create the same sources; let the
+            # (name, type) constraint arbitrate instead of failing
+            stmt = insert(Source).values(missing).on_conflict_do_nothing(
+                constraint='unique_source_name_type'
+            ).returning(Source.name, Source.id)
+            source_ids.update(dict(self.db.execute(stmt).all()))
+
+            # Rows another worker inserted first are not returned above
+            unresolved = [row['name']
+                          for row in missing if row['name'] not in source_ids]
+            if unresolved:
+                source_ids.update(dict(self.db.query(Source.name, Source.id).filter(
+                    Source.name.in_(unresolved),
+                    Source.type == self.source_type
+                ).all()))
+            self.db.commit()
+
+        return source_ids
+
     @abstractmethod
     def fetch_articles(self, since: Optional[datetime] = None, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -26,6 +26,8 @@ class LinkedInConnector(BaseConnector):
         self.credentials = credentials or {}
         self.logger = logging.getLogger("linkedin_connector")
         self.cookies_path = "/tmp/linkedin_cookies.json"
+        # Source ids by name, resolved once per fetch rather than per post
+        self._source_ids: Dict[str, int] = {}
 
         # Optional long-lived auth cookie (preferred over headless login)
         # Set LINKEDIN_LI_AT in the environment to skip the login flow and avoid security challenges.
@@ -137,12 +139,23 @@ class LinkedInConnector(BaseConnector):
         self.logger.info(
             f"Scraping LinkedIn hashtag: #{hashtag} for industry {industry}")
         await page.goto(url, timeout=60000)
-        await asyncio.sleep(2 + random.random())
+        try:
+            await page.wait_for_load_state("networkidle", timeout=3000)
+        except Exception:
+            pass  # LinkedIn keeps background requests open; carry on regardless
 
-        # Scroll to load posts
+        # Scroll to load posts, stopping as soon as a scroll loads nothing new
+        height = await page.evaluate("document.body.scrollHeight")
         for _ in range(3):
             await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-            await asyncio.sleep(1 + random.random())
+            try:
+                await page.wait_for_function(
+                    "h => document.body.scrollHeight > h",
+                    arg=height, polling=200, timeout=3000
+                )
+            except Exception:
+                break
+            height = await page.evaluate("document.body.scrollHeight")
 
         # Extract post elements – try multiple selectors to account for LinkedIn markup variations.
         posts = await page.query_selector_all("div.occludable-update")
@@ -232,19 +245,22 @@ class LinkedInConnector(BaseConnector):
 
         return results
 
+    def _source_fields(self, industry: str, hashtag: str) -> Dict[str, str]:
+        """Build the source name, url and description for a LinkedIn hashtag"""
+        return {
+            'name': f"LinkedIn - {industry} - #{hashtag}",
+            'url': f"{self.HASHTAG_URL}/{hashtag}/",
+            'description': f"LinkedIn #{hashtag} posts for {industry} industry"
+        }
+
     def _get_source_id(self, industry: str, hashtag: str) -> int:
         """Get or create a source for LinkedIn hashtag"""
-        source_name = f"LinkedIn - {industry} - #{hashtag}"
-        source_url = f"{self.HASHTAG_URL}/{hashtag}/"
-        source_description = f"LinkedIn #{hashtag} posts for {industry} industry"
-
-        source = self.get_or_create_source(
-            name=source_name,
-            url=source_url,
-            description=source_description
-        )
+        fields = self._source_fields(industry, hashtag)
+        if fields['name'] not in self._source_ids:
+            source = self.get_or_create_source(**fields)
+            self._source_ids[fields['name']] = source.id
 
-        return source.id
+        return self._source_ids[fields['name']]
 
     async def _fetch(self, since: datetime, limit: int) -> List[Dict[str, Any]]:
         browser, page = await self._setup()
@@ -253,6 +269,13 @@ class LinkedInConnector(BaseConnector):
                 self.logger.error("LinkedIn login failed. Cannot fetch posts.")
                 return []
 
+            # Resolve all hashtag sources in one round trip
+            self._source_ids = self.get_or_create_source_ids([
+                self._source_fields(industry, tag)
+                for industry, tags in self.hashtags.items()
+                for tag in tags[:2]
+            ])
+
             # Calculate posts per tag to distribute evenly
             total_tags = sum(len(tags) for tags in self.hashtags.values())
             posts_per_tag = max(limit // total_tags, 1)
@@ -1,11 +1,65 @@
-import requests
+import asyncio
+import logging
+import re
+import httpx
+import orjson
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
-from app.feeds.base import BaseConnector
+from app.feeds.base import ArticleRecord, BaseConnector
 from app.db.models import SourceType
 from app.core.config import settings
+from app.core.redis import FEED_CACHE_PREFIX, get_cached, set_cached
+from app.core.http import DEFAULT_HEADERS, DEFAULT_TIMEOUT, RETRY_STATUSES
+
+logger = logging.getLogger(__name__)
+
+# Cap on concurrent connections to NewsAPI while fanning out topic queries
+MAX_CONCURRENT_REQUESTS = 8
+
+# NewsAPI rejects 'q' values longer than this, which bounds how many
+# topics can be OR-combined into one request
+MAX_QUERY_LENGTH = 500
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# How long a query response is served from Redis before querying NewsAPI again
+NEWSAPI_CACHE_TTL = 900
+
+# Article fields kept in Article.raw_json
+RAW_JSON_FIELDS = ('source', 'author', 'title', 'description',
+                   'url', 'urlToImage', 'publishedAt')
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry on network errors and on rate-limit/server-error responses"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+@lru_cache(maxsize=256)
+def _topic_terms(topic: str) -> frozenset:
+    """Lowercased words of a topic, all of which NewsAPI requires to match"""
+    return frozenset(_WORD_RE.findall(topic.lower()))
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, memoized since syndicated items repeat them"""
+    try:
+        # Ensure we return a timezone-aware datetime
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        # Double check it has timezone info
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+    except Exception as e:
+        logger.debug("Error parsing datetime %r: %s", date_str, e)
+        return None
 
 
 class NewsAPIConnector(BaseConnector):
@@ -32,16 +86,78 @@ class NewsAPIConnector(BaseConnector):
 
     def _parse_datetime(self, date_str: str) -> Optional[datetime]:
         """Parse the datetime from NewsAPI response"""
-        try:
-            # Ensure we return a timezone-aware datetime
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            # Double check it has timezone info
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception as e:
-            print(f"Error parsing datetime '{date_str}': {e}")
-            return None
+        return _parse_iso(date_str)
+
+    def _build_queries(self) -> List[Tuple[str, List[str]]]:
+        """
+        Combine topics into as few OR queries as NewsAPI's query length allows
+
+        Returns:
+            List of (query, topics) pairs, one per request to issue
+        """
+        queries = []
+        clauses, chunk = [], []
+        for topic in self.topics:
+            clause = f"({topic})"
+            if chunk and len(" OR ".join(clauses + [clause])) > MAX_QUERY_LENGTH:
+                queries.append((" OR ".join(clauses), chunk))
+                clauses, chunk = [], []
+            clauses.append(clause)
+            chunk.append(topic)
+
+        if chunk:
+            queries.append((" OR ".join(clauses), chunk))
+        return queries
+
+    @staticmethod
+    def _match_topic(article: Dict[str, Any], topics: List[str]) -> str:
+        """Pick the topic of a combined query that an article most likely matched"""
+        text = f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+        words = set(_WORD_RE.findall(text))
+        for topic in topics:
+            if _topic_terms(topic) <= words:
+                return topic
+        # The match was in the body, which NewsAPI truncates; credit the first topic
+        return topics[0]
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=8),
+        reraise=True
+    )
+    async def _fetch_query(self, client: httpx.AsyncClient, query: str, from_param: str, limit: int) -> bytes:
+        """Fetch the raw NewsAPI response body for a single query"""
+        # Prepare request parameters
+        params = {
+            'q': query,
+            'sortBy': 'publishedAt',
+            'pageSize': min(limit, 100),  # NewsAPI's max pageSize is 100
+            'language': 'en',
+            'apiKey': self.api_key
+        }
+
+        if from_param:
+            params['from'] = from_param
+
+        # Make the API request
+        logger.debug("NewsAPI query q=%r from=%s pageSize=%d",
+                     query, from_param, params['pageSize'])
+        response = await client.get(self.BASE_URL, params=params)
+        response.raise_for_status()  # Raise exception for 4XX/5XX responses
+        return response.content
+
+    async def _fetch_queries(self, queries: List[str], from_param: str, limit: int) -> List[Any]:
+        """Fetch the given queries concurrently over one pooled client"""
+        limits = httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS)
+        connect_timeout, read_timeout = DEFAULT_TIMEOUT
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout, headers=DEFAULT_HEADERS) as client:
+            return await asyncio.gather(
+                *[self._fetch_query(client, query, from_param, limit)
+                  for query in queries],
+                return_exceptions=True
+            )
 
     def fetch_articles(self, since: Optional[datetime] = None, limit: int = 100) -> List[Dict[str, Any]]:
         """Fetch articles from NewsAPI based on configured topics"""
@@ -55,36 +171,56 @@ class NewsAPIConnector(BaseConnector):
         # Look back 30 days instead of using since parameter to ensure we get results
         thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
         from_param = thirty_days_ago.strftime("%Y-%m-%d")
-        print(f"[DEBUG] NewsAPI looking for articles since: {from_param}")
+        logger.debug("NewsAPI looking for articles since: %s", from_param)
 
-        for topic in self.topics:
-            # Create or get source for this topic
-            source = self.get_or_create_source(
-                name=f"NewsAPI - {topic}",
-                description=f"NewsAPI feed for topic: {topic}"
-            )
-
-            # Prepare request parameters
-            params = {
-                'q': topic,
-                'sortBy': 'publishedAt',
-                'pageSize': min(limit, 100),  # NewsAPI's max pageSize is 100
-                'language': 'en',
-                'apiKey': self.api_key
+        # Resolve the per-topic sources up front in a single round trip
+        source_ids = self.get_or_create_source_ids([
+            {
+                'name': f"NewsAPI - {topic}",
+                'description': f"NewsAPI feed for topic: {topic}"
             }
+            for topic in self.topics
+        ])
+
+        # Topics are OR-combined so a handful of requests cover all of them
+        queries = self._build_queries()
+
+        # Serve recently fetched queries from Redis and only request the rest
+        cache_keys = {
+            query: f"{FEED_CACHE_PREFIX}newsapi:{query}:{from_param}:{min(limit, 100)}"
+            for query, _ in queries
+        }
+        payloads = {query: get_cached(key) for query, key in cache_keys.items()}
+        missing = [query for query, payload in payloads.items()
+                   if payload is None]
+        logger.debug("NewsAPI cache hits: %d, misses: %d",
+                     len(payloads) - len(missing), len(missing))
 
-            if from_param:
-                params['from'] = from_param
+        if missing:
+            # Issue the remaining requests concurrently; DB work stays synchronous
+            responses = asyncio.run(
+                self._fetch_queries(missing, from_param, limit))
+            for query, response in zip(missing, responses):
+                if not isinstance(response, Exception):
+                    set_cached(cache_keys[query], NEWSAPI_CACHE_TTL, response)
+                payloads[query] = response
 
+        for query, topics in queries:
+            payload = payloads[query]
+
+            if isinstance(payload, Exception):
+                # Log error but continue with other queries
+                logger.error("Error fetching from NewsAPI for topics %r: %s",
+                             topics, payload, exc_info=payload)
+                continue
+
+            # A truncated or non-JSON body, or a corrupt cached entry, only
+            # loses this query's articles
             try:
-                # Make the API request
-                print(
-                    f"[DEBUG] Querying NewsAPI for topic: '{topic}' with params: {params}")
-                response = requests.get(self.BASE_URL, params=params)
-                response.raise_for_status()  # Raise exception for 4XX/5XX responses
-                data = response.json()
-                print(
-                    f"[DEBUG] NewsAPI returned {len(data.get('articles', []))} articles for topic '{topic}', total results: {data.get('totalResults', 0)}")
+                data = orjson.loads(payload)
+
+                logger.debug("NewsAPI returned %d articles for topics %r, total results: %s",
+                             len(data.get('articles', [])), topics, data.get('totalResults', 0))
 
                 # Process articles
                 for article in data.get('articles', []):
@@ -100,38 +236,33 @@ class NewsAPIConnector(BaseConnector):
                         published_at = published_at.replace(
                             tzinfo=timezone.utc)
 
-                    # Skip if older than 'since' parameter (with proper timezone handling)
-                    if since:
-                        # Ensure since has timezone info
-                        since_aware = since if since.tzinfo else since.replace(
-                            tzinfo=timezone.utc)
-                        if published_at < since_aware:
-                            continue
+                    # Skip if older than 'since' parameter (made timezone-aware above)
+                    if since and published_at < since:
+                        continue
+
+                    topic = self._match_topic(article, topics)
 
                     # Extract data
-                    article_data = {
-                        'source_id': source.id,
-                        'title': article.get('title', ''),
-                        'url': article.get('url', ''),
-                        'author': article.get('author', ''),
-                        'published_at': published_at,
-                        'content': article.get('content', '') or article.get('description', ''),
-                        'raw_json': article
-                    }
-
-                    results.append(article_data)
+                    results.append(ArticleRecord(
+                        source_id=source_ids[f"NewsAPI - {topic}"],
+                        title=article.get('title', ''),
+                        url=article.get('url', ''),
+                        author=article.get('author', ''),
+                        published_at=published_at,
+                        content=article.get('content', '') or article.get('description', ''),
+                        raw_json={key: article.get(key) for key in RAW_JSON_FIELDS}
+                    ))
 
                     # Stop if we've reached the limit
                     if len(results) >= limit:
                         break
-
-            except Exception as e:
-                # Log error but continue with other topics
-                print(
-                    f"[ERROR] Error fetching from NewsAPI for topic '{topic}': {e}")
-                # Print full exception details for debugging
-                import traceback
-                print(traceback.format_exc())
+            except (orjson.JSONDecodeError, KeyError) as e:
+                logger.error("Error processing NewsAPI response for topics %r: %s",
+                             topics, e, exc_info=True)
                 continue
 
-        return results[:limit]
+            # No need to decode the remaining responses once the limit is met
+            if len(results) >= limit:
+                break
+
+        return [record.to_dict() for record in results[:limit]]
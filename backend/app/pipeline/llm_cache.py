@@ -0,0 +1,49 @@
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+import redis
+
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix and lifetime of cached completion results
+LLM_CACHE_PREFIX = "llm:"
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Completions sampled above this temperature vary too much to reuse
+LLM_CACHE_MAX_TEMPERATURE = 0.5
+
+
+def llm_cache_key(model: str, prompt: str) -> str:
+    """Cache key for a completion, scoped to the model that produced it"""
+    digest = hashlib.sha256(f"{model}|{prompt}".encode("utf-8")).hexdigest()
+    return f"{LLM_CACHE_PREFIX}{digest}"
+
+
+def get_cached_completion(model: str, prompt: str) -> Optional[Dict[str, Any]]:
+    """Return the cached parsed completion for a prompt, or None on a miss"""
+    try:
+        value = get_redis_client().get(llm_cache_key(model, prompt))
+    except redis.RedisError as e:
+        logger.warning("LLM cache lookup failed: %s", e)
+        return None
+
+    if value is None:
+        return None
+
+    try:
+        return orjson.loads(value)
+    except ValueError:
+        return None
+
+
+def set_cached_completion(model: str, prompt: str, result: Dict[str, Any]) -> None:
+    """Cache a parsed completion in Redis"""
+    try:
+        get_redis_client().setex(llm_cache_key(model, prompt), LLM_CACHE_TTL,
+                                 orjson.dumps(result))
+    except redis.RedisError as e:
+        logger.warning("LLM cache write failed: %s", e)
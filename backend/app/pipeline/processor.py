@@ -1,22 +1,435 @@
-import math
-from typing import List, Dict, Tuple, Optional, Any
+import atexit
+import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import logging
-import json
+import orjson
 import re
+import threading
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from openai import OpenAI, AsyncOpenAI
-from sqlalchemy import func
-from app.db.models import Article, Industry
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+import tiktoken
+from cachetools import TTLCache
+from dateutil import parser as date_parser
+from pgvector import HalfVector
+from openai import APIConnectionError, APITimeoutError, BadRequestError, InternalServerError, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from app.db.models import Article, Industry, RECENCY_DECAY, normalize_url
 from app.core.config import settings
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+import redis
 from app.core.redis import get_redis_client
+from app.core.openai_client import get_async_openai_client, get_openai_client, get_openai_rate_limiter
+from app.pipeline.embedding_cache import embedding_cache_key, get_cached_embedding, set_cached_embedding
+from app.pipeline.llm_cache import LLM_CACHE_MAX_TEMPERATURE, get_cached_completion, set_cached_completion
+from app.pipeline.url_bloom import ensure_url_bloom, url_bloom_add, url_bloom_contains
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Transient OpenAI failures worth retrying with exponential backoff
+RETRYABLE_OPENAI_ERRORS = (RateLimitError, APIConnectionError,
+                           APITimeoutError, InternalServerError)
+
+# Scoring instructions live in the system prompt and the persona block comes
+# next, so every request in a batch shares a byte-identical prefix that
+# OpenAI's automatic prompt caching can reuse
+_PERSONA_SCORING_CRITERIA = """Consider the following aspects:
+1. How relevant is this article to the person's job role and responsibilities?
+2. How relevant is this article to the person's company or industry?
+3. How well does this article connect to their previous conversation context?
+4. Would this content be valuable to this specific person?
+
+Return a relevance score between 0.0 and 1.0 where:
+- 0.0 means completely irrelevant
+- 1.0 means extremely relevant and perfectly aligned with their interests"""
+
+PERSONA_SCORING_SYSTEM_PROMPT = f"""You are a precision relevance scoring system that evaluates content relevance to specific personas.
+
+You will be given information about a person, followed by an article. Determine how relevant the article is to that specific person.
+
+{_PERSONA_SCORING_CRITERIA}
+
+Output only the numerical score (e.g., 0.87) without any explanation or additional text."""
+
+# Variant for scoring several numbered articles against one persona at once
+PERSONA_GROUP_SCORING_SYSTEM_PROMPT = f"""You are a precision relevance scoring system that evaluates content relevance to specific personas.
+
+You will be given information about a person, followed by several numbered articles. Determine how relevant each article is to that specific person.
+
+{_PERSONA_SCORING_CRITERIA}
+
+Answer with a JSON object whose "scores" list holds one {{"id": <article number>, "score": <score>}} object per article, in the same order."""
+# Articles scored per request, sharing a single copy of the persona, and the
+# completion budget for each article's entry in the answer
+PERSONA_SCORING_GROUP_SIZE = 30
+PERSONA_SCORE_MAX_TOKENS = 16
+# Completion budget for a single bare score such as "0.87"
+SINGLE_SCORE_MAX_TOKENS = 5
+
+# Lifetime of cached persona scores in Redis, with an in-process layer in
+# front for repeated rankings of the same persona. The local layer expires
+# with the Redis entries and is shared by request and worker threads, so
+# every access holds the lock
+PERSONA_SCORE_CACHE_TTL = 24 * 60 * 60
+_persona_score_cache = TTLCache(maxsize=10_000, ttl=PERSONA_SCORE_CACHE_TTL)
+_persona_score_cache_lock = threading.Lock()
+
+# Answer format for group scoring; structured outputs keep the answer to
+# exactly this shape, so it always parses
+PERSONA_GROUP_SCORES_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "persona_scores",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"scores": {"type": "array", "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, "score": {"type": "number"}},
+                "required": ["id", "score"],
+                "additionalProperties": False
+            }}},
+            "required": ["scores"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Fused enrichment request settings. Fixed instructions live in the system
+# prompt so the per-article message only carries fields and article text;
+# it is part of the LLM cache key, so editing it invalidates cached results
+ENRICHMENT_SYSTEM_PROMPT = """You are a helpful assistant that summarizes, classifies and extracts metadata from articles.
+Always answer with a single JSON object containing exactly the fields the user asks for.
+
+IMPORTANT: Use common acronyms and shorter forms for keywords when appropriate:
+- Use "AI" instead of "Artificial Intelligence"
+- Use "ML" instead of "Machine Learning"
+- Use "NLP" instead of "Natural Language Processing"
+- Use "UI/UX" instead of "User Interface/User Experience"
+- Keep keywords brief and concise
+
+Example keywords: ["AI", "Fraud Detection", "Banking"] instead of ["Artificial Intelligence", "Fraud Detection Systems", "Banking Industry"]"""
+ENRICHMENT_TEMPERATURE = 0.3
+# Completion budget per article; a group request gets this much per article.
+# A 2-3 sentence summary, three keywords and the metadata fields take about
+# 150 tokens, so this leaves headroom without letting a runaway answer bill long
+ENRICHMENT_MAX_TOKENS = 250
+# Industry labels the model answers with, constrained by the response
+# schema and mapped onto Industry by _map_industry
+ENRICHMENT_INDUSTRY_LABELS = ("BFSI", "Retail", "Healthcare", "Technology", "Other")
+# Articles enriched together in one request, sharing a single copy of the
+# instructions; small enough to keep each answer well inside the output limit
+ENRICHMENT_GROUP_SIZE = 10
+# Article text sent for enrichment; the lead carries the summary, byline and
+# date, and longer bodies only add prompt tokens
+ENRICHMENT_CONTENT_CHARS = 2000
+
+# Map the model's industry label to our Industry enum values
+INDUSTRY_MAPPING = {
+    "bfsi": Industry.BFSI,
+    "banking": Industry.BFSI,
+    "financial": Industry.BFSI,
+    "finance": Industry.BFSI,
+    "insurance": Industry.BFSI,
+    "retail": Industry.RETAIL,
+    "healthcare": Industry.HEALTHCARE,
+    "health": Industry.HEALTHCARE,
+    "medical": Industry.HEALTHCARE,
+    "technology": Industry.TECHNOLOGY,
+    "tech": Industry.TECHNOLOGY,
+    "other": Industry.OTHER
+}
+
+# Word patterns for multi-word labels such as "Banking industry" that miss
+# the exact lookup above; the first matching rule wins
+_INDUSTRY_RULES = (
+    (re.compile(r'\b(?:bfsi|banking|financial|finance|insurance)\b'), Industry.BFSI),
+    (re.compile(r'\bretail\b'), Industry.RETAIL),
+    (re.compile(r'\b(?:healthcare|health|medical)\b'), Industry.HEALTHCARE),
+    (re.compile(r'\b(?:technology|tech)\b'), Industry.TECHNOLOGY),
+)
+
+# Word stems that place an article in an industry without asking the model,
+# checked in order so domain industries win over the catch-all technology
+INDUSTRY_KEYWORDS = {
+    Industry.BFSI: ("bank", "financ", "insur", "wealth", "investment", "trading", "fintech", "bfsi"),
+    Industry.RETAIL: ("retail", "ecommerce", "e-commerce", "shop", "store", "consumer", "merchandis"),
+    Industry.HEALTHCARE: ("health", "medical", "pharma", "biotech", "hospital", "clinic", "patient"),
+    Industry.TECHNOLOGY: ("tech", "software", "hardware", "cloud", "saas", "digital", "computer"),
+}
+# All stems in one alternation with a named group per industry, so the
+# text is scanned once and each match reports its industry via lastgroup
+_INDUSTRY_TEXT_RE = re.compile('|'.join(
+    rf'(?P<{industry.value}>\b(?:' + '|'.join(map(re.escape, stems)) + '))'
+    for industry, stems in INDUSTRY_KEYWORDS.items()
+), re.IGNORECASE)
+# Characters of content scanned by the keyword heuristic, and the content
+# length above which an unclassified article is worth asking the model about
+INDUSTRY_SCAN_CHARS = 500
+
+# raw_json fields that may carry the author or publication date;
+# different sources use different field names
+AUTHOR_CANDIDATE_FIELDS = ('author', 'byline', 'creator', 'dc:creator')
+DATE_CANDIDATE_FIELDS = ('publishedAt', 'pubDate',
+                         'date', 'dc:date', 'created', 'published')
+
+# Cheap pre-scans for whether content could mention a byline or a date at
+# all; the model is only asked for a field when its hint is present
+_DATE_HINT = re.compile(
+    r'\b(?:19|20)\d{2}\b|\b(?:January|February|March|April|May|June|July'
+    r'|August|September|October|November|December)\b', re.IGNORECASE)
+_BYLINE_HINT = re.compile(r'\b(?:by|author|reporter)\b', re.IGNORECASE)
+METADATA_SCAN_CHARS = 2000
+
+# Bylines ("By Jane Doe") and datelines ("2025-05-20", "20 May 2025",
+# "May 20, 2025") that can be read straight from the content for free.
+# Both must open a line, so "led by Sequoia Capital" or a date the story
+# merely mentions is left for the model instead of being taken as metadata
+_BYLINE_RE = re.compile(
+    r"^[ \t]*[Bb]y[ \t]+([A-Z][a-z]+(?:[ \t]+[A-Z][A-Za-z'-]+){1,3})[ \t]*(?:$|[,|])", re.M)
+_MONTH_PATTERN = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?'
+_DATE_RE = re.compile(
+    r'\b(?P<iso_y>20\d{2})-(?P<iso_m>\d{2})-(?P<iso_d>\d{2})\b'
+    rf'|\b(?P<dm_d>\d{{1,2}})\s+(?P<dm_m>{_MONTH_PATTERN}),?\s+(?P<dm_y>20\d{{2}})\b'
+    rf'|\b(?P<md_m>{_MONTH_PATTERN})\s+(?P<md_d>\d{{1,2}}),?\s+(?P<md_y>20\d{{2}})\b')
+_DATELINE_RE = re.compile(
+    r'^[ \t]*(?:(?i:published|updated|posted)(?:[ \t]+on)?:?[ \t]+)?(?:' + _DATE_RE.pattern + ')',
+    re.M)
+_MONTHS = {name: number for number, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1)}
+
+# Separators a model may put between keywords when it returns plain text
+_KW_SPLIT = re.compile(r'[,\n;]+')
+
+# Keywords used when extraction fails entirely
+DEFAULT_KEYWORDS = ("AI", "Technology", "News")
+
+# Article columns written on insert; id and the timestamps come from
+# the database sequence and the column defaults
+_ARTICLE_INSERT_COLUMNS = tuple(
+    column.key for column in Article.__table__.columns
+    if column.key not in ("id", "created_at", "updated_at"))
+
+# Enriched articles embedded and saved together, and how many such groups
+# may wait for the writer before enrichment pauses
+WRITE_BATCH_SIZE = 64
+WRITE_QUEUE_SIZE = 4
+
+# Texts sent per embeddings request; the endpoint accepts up to 2048 inputs
+EMBEDDING_BATCH_SIZE = 128
+# Inputs are capped at 8191 tokens each and a request at 300k tokens in
+# total; batches are packed against a budget safely under the latter
+EMBEDDING_MAX_INPUT_TOKENS = 8191
+EMBEDDING_MAX_REQUEST_TOKENS = 250_000
+
+# Embedding requests sent in parallel when a group needs more than one;
+# long-lived so every group reuses the same threads
+EMBEDDING_REQUEST_WORKERS = 4
+_EMBEDDING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=EMBEDDING_REQUEST_WORKERS, thread_name_prefix="embedding-request")
+atexit.register(_EMBEDDING_EXECUTOR.shutdown)
+
+
+def _parse_relevance_score(result: str) -> float:
+    """Parse a model's relevance score, clamped to 0-1 with 0.5 as the fallback"""
+    try:
+        # Ensure it's within 0-1 range
+        return max(0.0, min(1.0, float(result.strip())))
+    except ValueError:
+        logger.warning(f"Failed to parse OpenAI relevance score: {result}")
+        return 0.5
+
+
+def _find_content_date(text: str) -> Optional[datetime]:
+    """Return the first valid dateline date in the text, as UTC midnight"""
+    for match in _DATELINE_RE.finditer(text):
+        if match.group('iso_y'):
+            year, month, day = match.group('iso_y', 'iso_m', 'iso_d')
+        elif match.group('dm_y'):
+            year, month, day = match.group('dm_y', 'dm_m', 'dm_d')
+        else:
+            year, month, day = match.group('md_y', 'md_m', 'md_d')
+
+        if not month.isdigit():
+            month = _MONTHS[month[:3].lower()]
+        try:
+            return datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_raw_date(value: Any) -> Optional[datetime]:
+    """Parse a date string from raw source data into a timezone-aware datetime"""
+    if not isinstance(value, str):
+        return None
+    return _parse_date_string(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Memoized date parsing, since syndicated items repeat the same timestamps"""
+    # Pick the likely parser up front rather than letting it fail first: a
+    # comma marks RFC 2822 dates from RSS ("Tue, 20 May 2025 10:00:00 GMT"),
+    # anything else is tried as ISO 8601, which most other sources use
+    parsers = ((parsedate_to_datetime, datetime.fromisoformat) if ',' in value
+               else (datetime.fromisoformat,))
+    try:
+        parsed_date = None
+        for parse in parsers:
+            try:
+                parsed_date = parse(value)
+                break
+            except (TypeError, ValueError):
+                continue
+        if parsed_date is None:
+            # Handles any other free-form format
+            parsed_date = date_parser.parse(value)
+    except (ValueError, OverflowError) as e:
+        logger.warning(f"Error parsing date: {e}")
+        return None
+
+    # Add timezone info if missing
+    if parsed_date.tzinfo is None:
+        parsed_date = parsed_date.replace(tzinfo=timezone.utc)
+    return parsed_date
+
+
+@dataclass(slots=True)
+class EnrichmentRequest:
+    """One article's text and which optional fields to ask the model for"""
+    title: str
+    content: str
+    want_industry: bool = True
+    want_author: bool = True
+    want_date: bool = True
+
+
+def _enrichment_fields(request: EnrichmentRequest) -> str:
+    """The JSON fields to request for an article, one instruction per line"""
+    fields = ['- "summary": the article summarized in 2-3 sentences']
+    if request.want_industry:
+        fields.append(
+            '- "industry": exactly ONE of BFSI (Banking, Financial Services, Insurance), Retail, Healthcare, Technology, Other, as a single word')
+    fields.append('- "keywords": a list of exactly 3 most relevant keywords')
+    if request.want_author:
+        fields.append('- "author": the author name, or null if not found')
+    if request.want_date:
+        fields.append(
+            '- "date": the publication date as "YYYY-MM-DD", or null if not found')
+    return "\n".join(fields)
+
+
+def _enrichment_prompt(request: EnrichmentRequest) -> str:
+    """Single-article enrichment prompt, also the LLM cache key for that article"""
+    return f"""Analyze this article and return a JSON object with these fields:
+{_enrichment_fields(request)}
+
+Title: {request.title}
+
+Content: {request.content}"""
+
+
+@lru_cache(maxsize=16)
+def _enrichment_schema(want_industry: bool, want_author: bool, want_date: bool, with_id: bool = False) -> Dict[str, Any]:
+    """
+    Strict JSON schema for one article's enrichment answer
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    properties: Dict[str, Any] = {}
+    if with_id:
+        properties["id"] = {"type": "integer"}
+    properties["summary"] = {"type": "string"}
+    if want_industry:
+        properties["industry"] = {"type": "string",
+                                  "enum": list(ENRICHMENT_INDUSTRY_LABELS)}
+    properties["keywords"] = {"type": "array", "items": {"type": "string"}}
+    if want_author:
+        properties["author"] = {"type": ["string", "null"]}
+    if want_date:
+        properties["date"] = {"type": ["string", "null"]}
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+def _enrichment_response_format(requests: List[EnrichmentRequest]) -> Dict[str, Any]:
+    """
+    Structured output format for enriching one article, or a group of them
+
+    A group answer is an "articles" list whose items carry every field any
+    article in the group asks for; fields an article did not ask for are
+    ignored when its answer is parsed.
+    """
+    wanted = (any(request.want_industry for request in requests),
+              any(request.want_author for request in requests),
+              any(request.want_date for request in requests))
+    if len(requests) == 1:
+        name, schema = "article_enrichment", _enrichment_schema(*wanted)
+    else:
+        name, schema = "article_enrichments", {
+            "type": "object",
+            "properties": {"articles": {
+                "type": "array", "items": _enrichment_schema(*wanted, with_id=True)}},
+            "required": ["articles"],
+            "additionalProperties": False
+        }
+    return {"type": "json_schema",
+            "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+
+def _embedding_array(embedding: Any) -> np.ndarray:
+    """An article embedding, fresh or loaded from halfvec, as a float32 array"""
+    if isinstance(embedding, HalfVector):
+        embedding = embedding.to_numpy()
+    return np.asarray(embedding, dtype=np.float32)
+
+
+@lru_cache(maxsize=8)
+def _embedding_encoding(model: str) -> tiktoken.Encoding:
+    """Tokenizer for an embedding model, loaded once per process"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=256)
+def _persona_term_matcher(job_title: str, company: str, industry: str) -> Tuple[Optional[re.Pattern], Dict[str, frozenset]]:
+    """
+    Compile a persona's fallback match terms into a single case-insensitive regex
+
+    Returns:
+        The compiled alternation (None if there are no terms) and a map from
+        each term to the match categories it counts towards
+    """
+    term_categories: Dict[str, set] = {}
+    terms = [(word, "job_title") for word in job_title.split() if len(word) > 3]
+    terms += [(company, "company"), (industry, "industry")]
+    for term, category in terms:
+        if term:
+            term_categories.setdefault(term, set()).add(category)
+
+    if not term_categories:
+        return None, {}
+
+    # Longest first so a longer term wins over any term it contains
+    alternation = "|".join(re.escape(term) for term in sorted(
+        term_categories, key=len, reverse=True))
+    return re.compile(alternation, re.IGNORECASE), {term: frozenset(categories) for term, categories in term_categories.items()}
+
 
 class ArticleProcessor:
     """Process articles through the full pipeline: 
@@ -29,9 +442,8 @@ class ArticleProcessor:
 
     def __init__(self, db: Session):
         self.db = db
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        # Add async client for parallel processing
-        self.async_openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # Process-wide client, so new processors reuse warm connections
+        self.openai_client = get_openai_client()
         # Add Redis client for caching
         self.redis_client = get_redis_client()
 
@@ -45,15 +457,172 @@ class ArticleProcessor:
         Returns:
             List of Article objects that were successfully processed and saved
         """
-        processed_articles = []
+        return asyncio.run(self.aprocess_articles(articles))
+
+    async def aprocess_articles(self, articles: List[Dict[str, Any]]) -> List[Article]:
+        """
+        Async version of process_articles for callers already inside an event loop
+
+        Enriched articles are handed to a writer in groups of WRITE_BATCH_SIZE,
+        which embeds and saves each group in worker threads while the
+        remaining OpenAI requests are still in flight, embedding one group
+        while the previous one is being saved.
+        """
+        new_articles = await asyncio.to_thread(self._prepare, articles)
+        if not new_articles:
+            return []
+
+        # Bounded so enrichment cannot run arbitrarily far ahead of the writer
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+        writer = asyncio.create_task(self._write_batches(queue))
+
+        semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        groups = [new_articles[i:i + ENRICHMENT_GROUP_SIZE]
+                  for i in range(0, len(new_articles), ENRICHMENT_GROUP_SIZE)]
+        batch = []
+        for enriched in asyncio.as_completed([
+                self._enrich_group(group, semaphore) for group in groups]):
+            batch.extend(await enriched)
+            if len(batch) >= WRITE_BATCH_SIZE:
+                await queue.put(batch)
+                batch = []
+
+        if batch:
+            await queue.put(batch)
+        await queue.put(None)
+        return await writer
+
+    async def _enrich_group(self, articles: List[Article], semaphore: asyncio.Semaphore) -> List[Article]:
+        """Enrich and score a group of articles with one request, dropping any that fail"""
+        requests = [self._plan_enrichment(article) for article in articles]
+        async with semaphore:
+            enrichments = await self._enrich_articles_llm([request for request, _ in requests])
+
+        enriched_articles = []
+        now = datetime.now(timezone.utc)
+        for article, (request, industry), enrichment in zip(articles, requests, enrichments):
+            if not request.want_industry:
+                enrichment["industry"] = industry
+            try:
+                self._apply_enrichment(article, enrichment)
+
+                # Calculate relevance score
+                article.relevance_score = self._calculate_relevance_score(
+                    article, now)
+                enriched_articles.append(article)
+
+            except Exception as e:
+                # Log error but continue with other articles
+                logger.warning(
+                    f"Error processing article '{article.title}': {e}")
+
+        return enriched_articles
+
+    def _plan_enrichment(self, article: Article) -> Tuple[EnrichmentRequest, str]:
+        """
+        Decide what to ask the model about an article
+
+        Returns:
+            The enrichment request and the heuristic industry, which is used
+            unless the request asks the model for one
+        """
+        content = article.content or ""
+        want_author, want_date = self._missing_metadata(article)
+
+        # The keyword heuristic settles most articles; the model is only
+        # asked when it finds nothing in substantial content, or keywords of
+        # more than one domain industry (technology always yields to a domain)
+        candidates = self._industry_candidates(
+            f"{article.title} {content[:INDUSTRY_SCAN_CHARS]}")
+        industry = candidates[0] if candidates else Industry.OTHER
+        domains = [c for c in candidates if c != Industry.TECHNOLOGY]
+        ambiguous = (len(domains) > 1
+                     or (not candidates and len(content) > INDUSTRY_SCAN_CHARS))
+        want_industry = ambiguous and settings.LLM_INDUSTRY_FALLBACK
+
+        return EnrichmentRequest(article.title, content[:ENRICHMENT_CONTENT_CHARS],
+                                 want_industry, want_author, want_date), industry
+
+    async def _write_batches(self, queue: asyncio.Queue) -> List[Article]:
+        """
+        Embed and save groups of enriched articles until a None sentinel arrives
+
+        A group that fails is logged and dropped rather than ending the
+        writer, since enrichment would otherwise block forever on the full
+        queue.
+        """
+        saved_articles = []
+        persisting = None
+        while (batch := await queue.get()) is not None:
+            # Embedding never touches the session, so each group is embedded
+            # while the previous one is still being saved
+            try:
+                await asyncio.to_thread(self._embed_articles, batch)
+            except Exception as e:
+                logger.error(f"Error embedding {len(batch)} articles: {e}")
+                continue
+            saved_articles.extend(await self._saved(persisting))
+            # One save at a time, so the session is never shared between threads
+            persisting = asyncio.create_task(
+                asyncio.to_thread(self._persist, batch))
+
+        saved_articles.extend(await self._saved(persisting))
+        return saved_articles
+
+    async def _saved(self, persisting: Optional[asyncio.Task]) -> List[Article]:
+        """Wait for a pending save, if any, and return the articles it stored"""
+        if persisting is None:
+            return []
+        try:
+            return await persisting
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error saving processed articles: {e}")
+            return []
+
+    def _embed_articles(self, articles: List[Article]) -> None:
+        """Embed a group of enriched articles in bulk"""
+        # Generate embeddings for vector search in as few requests as possible
+        embeddings = self._generate_embeddings_bulk([
+            f"{article.title}. {article.summary or article.content or ''}"
+            for article in articles
+        ])
+        for article, embedding in zip(articles, embeddings):
+            article.embedding = embedding
+
+    def _prepare(self, articles: List[Dict[str, Any]]) -> List[Article]:
+        """Drop articles already stored or repeated in the batch and build Article objects"""
+        new_articles = []
         # Track URLs we've seen in this batch to avoid duplicates within the batch
         processed_urls = set()
 
+        # Each URL is canonicalized once and reused by the loop below
+        normalized_urls = {article_data['url']: normalize_url(article_data['url'])
+                           for article_data in articles if article_data.get('url')}
+        batch_urls = set(normalized_urls.values())
+
+        # URLs the Bloom filter has never seen are certainly new, so only
+        # the possible hits need the database lookup
+        if batch_urls and ensure_url_bloom(self.db):
+            batch_urls &= url_bloom_contains(batch_urls)
+
+        # Check which URLs already exist in the database (deduplication)
+        # with one lookup on the unique url_normalized index for the whole
+        # batch. Older duplicate rows left without url_normalized need no
+        # raw URL match, since the row they collided with holds the value
+        existing_urls = {
+            url for (url,) in self.db.query(Article.url_normalized).filter(
+                Article.url_normalized.in_(batch_urls))
+        } if batch_urls else set()
+
         for article_data in articles:
             try:
-                # Normalize URL for comparison (lowercase, remove trailing slashes)
-                original_url = article_data['url']
-                normalized_url = original_url.lower().rstrip('/')
+                original_url = article_data.get('url')
+                if not original_url:
+                    logger.warning(
+                        f"Skipping article without a URL: '{article_data.get('title', '')}'")
+                    continue
+                normalized_url = normalized_urls[original_url]
 
                 # Skip if we've already processed this URL in the current batch
                 if normalized_url in processed_urls:
@@ -61,18 +630,7 @@ class ArticleProcessor:
                         f"Skipping duplicate URL in batch: {original_url}")
                     continue
 
-                # Check if article with this URL already exists in database (deduplication)
-                # Use SQL LIKE with pattern to handle trailing slashes
-                url_pattern = original_url.rstrip('/') + '%'
-                existing = self.db.query(Article).filter(
-                    func.lower(Article.url).like(func.lower(url_pattern))).first()
-
-                if not existing:
-                    # Double check with exact match as fallback
-                    existing = self.db.query(Article).filter(
-                        Article.url == original_url).first()
-
-                if existing:
+                if normalized_url in existing_urls:
                     logger.info(
                         f"Skipping existing article in database: {original_url}")
                     continue
@@ -80,152 +638,385 @@ class ArticleProcessor:
                 # Add to our processed URLs set
                 processed_urls.add(normalized_url)
 
-                # Create new article
                 article = Article(**article_data)
 
-                # Generate summary if content exists
-                if article.content:
-                    article.summary = self._generate_summary(
-                        article.title, article.content)
-
-                # Enrich metadata if needed
+                # Fill missing metadata from the raw source data first
                 if not article.author or not article.published_at:
                     author, date = self._enrich_metadata(
-                        article.title, article.content or "", article.url, article.raw_json)
-                    if not article.author and author:
-                        article.author = author
-                    if not article.published_at and date:
-                        article.published_at = date
-
-                # Classify industry
-                article.industry = self._classify_industry(
-                    article.title, article.content or "", article.summary or "")
-
-                # Extract keywords
-                article.keywords = self._extract_keywords(
-                    article.title, article.content or "", article.summary or "")
-
-                # Generate embeddings for vector search
-                article.embedding = self._generate_embedding(
-                    f"{article.title}. {article.summary or article.content or ''}"
-                )
-
-                # Calculate relevance score
-                article.relevance_score = self._calculate_relevance_score(
-                    article)
+                        article.raw_json, article.content)
+                    article.author = article.author or author
+                    article.published_at = article.published_at or date
 
-                # Save to database with explicit try/except for DB constraints
-                try:
-                    self.db.add(article)
-                    self.db.commit()
-                    self.db.refresh(article)
-                    processed_articles.append(article)
-                    logger.info(
-                        f"Successfully saved article: {article.title[:50]}")
-                except Exception as db_error:
-                    self.db.rollback()
-                    # If it's a duplicate constraint, log as info not warning
-                    if "unique_article_url" in str(db_error):
-                        logger.info(
-                            f"Duplicate URL detected: {article.url}")
-                    else:
-                        # For other database errors, log as warning
-                        logger.warning(
-                            f"Database error saving article '{article.title[:50]}': {db_error}")
-                        # Re-raise non-duplicate errors
-                        raise
+                new_articles.append(article)
 
             except Exception as e:
                 # Log error but continue with other articles
                 logger.warning(
                     f"Error processing article '{article_data.get('title', '')}': {e}")
-                self.db.rollback()
                 continue
 
-        return processed_articles
+        return new_articles
 
-    def _generate_summary(self, title: str, content: str, max_length: int = 200) -> str:
-        """Generate a concise summary of the article using OpenAI"""
-        try:
-            prompt = f"Summarize this article in 2-3 sentences:\nTitle: {title}\nContent: {content}"
-
-            response = self.openai_client.chat.completions.create(
-                model=settings.OPENAI_COMPLETION_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that summarizes articles concisely."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.3
-            )
+    def _missing_metadata(self, article: Article) -> Tuple[bool, bool]:
+        """
+        Decide whether the model should look for the author and the date
+
+        Returns:
+            Tuple of (want_author, want_date)
+        """
+        content = article.content or ""
+        # Only trust model-extracted metadata for substantial content
+        if len(content) <= 100:
+            return False, False
+
+        head = content[:METADATA_SCAN_CHARS]
+        want_author = not article.author and _BYLINE_HINT.search(head) is not None
+        want_date = not article.published_at and _DATE_HINT.search(head) is not None
+        return want_author, want_date
+
+    def _apply_enrichment(self, article: Article, enrichment: Dict[str, Any]) -> None:
+        """Copy the summary, classification and fallback metadata onto an article"""
+        # Use the generated summary if content exists
+        if article.content:
+            article.summary = enrichment["summary"]
+
+        # Metadata the raw source data did not provide
+        if not article.author and enrichment["author"]:
+            article.author = enrichment["author"]
+        if not article.published_at and enrichment["date"]:
+            article.published_at = enrichment["date"]
+
+        article.industry = enrichment["industry"]
+        article.keywords = enrichment["keywords"]
+
+    def _persist(self, articles: List[Article]) -> List[Article]:
+        """
+        Save enriched articles with one INSERT ... ON CONFLICT DO NOTHING
 
-            summary = response.choices[0].message.content.strip()
-            return summary
+        The unique constraints on url and url_normalized decide atomically
+        what is a duplicate, so a row a concurrent worker stored since the
+        preflight lookup is skipped instead of failing the batch.
+
+        Returns:
+            The articles actually inserted, with their ids set
+        """
+        if not articles:
+            return []
 
+        rows = [{column: getattr(article, column) for column in _ARTICLE_INSERT_COLUMNS}
+                for article in articles]
+        try:
+            inserted = dict(self.db.execute(
+                pg_insert(Article).on_conflict_do_nothing().returning(
+                    Article.url, Article.id),
+                rows
+            ).all())
+            # One commit for the whole batch
+            self.db.commit()
         except Exception as e:
-            logger.error(f"Error generating summary: {e}")
-            # Fallback to simple summary if OpenAI fails
-            return content[:max_length] + "..." if len(content) > max_length else content
+            self.db.rollback()
+            logger.error(f"Error saving processed articles: {e}")
+            return []
+
+        processed_articles = []
+        for article in articles:
+            if article.url in inserted:
+                article.id = inserted[article.url]
+                processed_articles.append(article)
+            else:
+                logger.info(f"Duplicate URL detected: {article.url}")
+
+        # Rows rejected as duplicates are stored too, so record every URL
+        url_bloom_add(article.url_normalized for article in articles)
+
+        logger.info(f"Successfully saved {len(processed_articles)} articles")
+        return processed_articles
+
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+        wait=wait_random_exponential(min=1, max=20),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _create_enrichment_completion_async(self, prompt: str, requests: List[EnrichmentRequest]):
+        """
+        Request an enrichment completion, backing off on rate limits
+
+        Structured outputs hold the answer to the schema for the requested
+        fields, so only a truncated answer can fail to parse.
+        """
+        await get_openai_rate_limiter().wait()
+        return await get_async_openai_client().chat.completions.create(
+            model=settings.OPENAI_COMPLETION_MODEL,
+            messages=[
+                {"role": "system", "content": ENRICHMENT_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=ENRICHMENT_MAX_TOKENS * len(requests),
+            temperature=ENRICHMENT_TEMPERATURE,
+            response_format=_enrichment_response_format(requests)
+        )
+
+    async def _enrich_articles_llm(self, requests: List[EnrichmentRequest]) -> List[Dict[str, Any]]:
+        """
+        Enrich several articles, sending every uncached one in a single OpenAI request
+
+        The shared instructions are paid for once per group rather than once
+        per article. Articles missing from the group answer, or the whole
+        group if the answer cannot be parsed, fall back to one request each;
+        if the request itself fails they get the defaults.
+
+        Returns:
+            One enrichment dict per request, in order (see _enrich_article_llm)
+        """
+        cached = [self._cached_enrichment(request) for request in requests]
+        pending = [idx for idx, result in enumerate(cached) if result is None]
 
-    def _classify_industry(self, title: str, content: str, summary: str) -> str:
-        """Classify the article into an industry category using OpenAI"""
+        request_failed = False
+        if len(pending) > 1:
+            blocks = "\n\n".join(
+                f"### Article {number}\nFields:\n{_enrichment_fields(requests[idx])}\n\n"
+                f"Title: {requests[idx].title}\n\nContent: {requests[idx].content}"
+                for number, idx in enumerate(pending, start=1))
+            prompt = f"""Analyze each of the following {len(pending)} articles. Return a JSON object with an "articles" list holding one object per article, in the same order. Each object has an "id" field set to the article's number plus the fields listed for that article:
+
+{blocks}"""
+
+            by_number = {}
+            try:
+                response = await self._create_enrichment_completion_async(
+                    prompt, [requests[idx] for idx in pending])
+            except Exception as e:
+                logger.error(f"Error enriching articles with OpenAI: {e}")
+                request_failed = True
+            else:
+                try:
+                    entries = orjson.loads(
+                        response.choices[0].message.content).get("articles") or []
+                    by_number = {int(entry["id"]): entry for entry in entries
+                                 if isinstance(entry, dict) and "id" in entry}
+                except Exception as e:
+                    logger.warning(
+                        f"Could not parse group enrichment of {len(pending)} articles, enriching one at a time: {e}")
+
+            for number, idx in enumerate(pending, start=1):
+                result = by_number.get(number)
+                if result is not None:
+                    cached[idx] = result
+                    self._cache_enrichment(requests[idx], result)
+
+        results = []
+        missing = [] if request_failed else [
+            idx for idx, result in enumerate(cached) if result is None]
+        fallback = dict(zip(missing, await asyncio.gather(*[
+            self._enrich_article_llm(requests[idx]) for idx in missing])))
+        for idx, request in enumerate(requests):
+            if idx in fallback:
+                results.append(fallback[idx])
+            else:
+                results.append(self._parse_enrichment(cached[idx], request))
+        return results
+
+    async def _enrich_article_llm(self, request: EnrichmentRequest, max_length: int = 200) -> Dict[str, Any]:
+        """
+        Generate summary, industry, keywords and metadata in a single OpenAI request
+
+        The industry, author and date are only requested when the matching
+        want_* flag is set. The caller has already missed the cache for
+        this article, so it is not looked up again.
+
+        Returns:
+            Dict with 'summary', 'industry', 'keywords', 'author' and 'date'.
+            Fields the model could not provide fall back to simple defaults.
+        """
         try:
-            # Combine title and summary for classification
-            text = f"Title: {title}\nSummary: {summary}\nExcerpt: {content[:500]}..."
-
-            prompt = f"Classify this article into exactly ONE of these industries: BFSI (Banking, Financial Services, Insurance), Retail, Healthcare, Technology, Other.\nReturn only the label as a single word.\n\n{text}"
-
-            response = self.openai_client.chat.completions.create(
-                model=settings.OPENAI_COMPLETION_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that classifies articles by industry."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.3
-            )
+            response = await self._create_enrichment_completion_async(
+                _enrichment_prompt(request), [request])
 
-            industry = response.choices[0].message.content.strip().lower()
-
-            # Map the response to our Industry enum values
-            industry_mapping = {
-                "bfsi": Industry.BFSI,
-                "banking": Industry.BFSI,
-                "financial": Industry.BFSI,
-                "finance": Industry.BFSI,
-                "insurance": Industry.BFSI,
-                "retail": Industry.RETAIL,
-                "healthcare": Industry.HEALTHCARE,
-                "health": Industry.HEALTHCARE,
-                "medical": Industry.HEALTHCARE,
-                "technology": Industry.TECHNOLOGY,
-                "tech": Industry.TECHNOLOGY,
-                "other": Industry.OTHER
-            }
-
-            return industry_mapping.get(industry, Industry.OTHER)
+            result = orjson.loads(response.choices[0].message.content)
 
         except Exception as e:
-            logger.error(f"Error classifying industry: {e}")
+            logger.error(f"Error enriching article with OpenAI: {e}")
+            result = {}
+
+        if result:
+            self._cache_enrichment(request, result)
+
+        return self._parse_enrichment(result, request, max_length)
+
+    def _cached_enrichment(self, request: EnrichmentRequest) -> Optional[Dict[str, Any]]:
+        """Return the cached model answer for an article, keyed by its single-article prompt"""
+        # Re-ingested or syndicated articles produce identical prompts
+        if ENRICHMENT_TEMPERATURE > LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        return get_cached_completion(
+            settings.OPENAI_COMPLETION_MODEL,
+            f"{ENRICHMENT_SYSTEM_PROMPT}\n{_enrichment_prompt(request)}")
+
+    def _cache_enrichment(self, request: EnrichmentRequest, result: Any) -> None:
+        """Cache a model answer for an article, however it was requested"""
+        if ENRICHMENT_TEMPERATURE <= LLM_CACHE_MAX_TEMPERATURE and isinstance(result, dict):
+            set_cached_completion(
+                settings.OPENAI_COMPLETION_MODEL,
+                f"{ENRICHMENT_SYSTEM_PROMPT}\n{_enrichment_prompt(request)}", result)
+
+    def _parse_enrichment(self, result: Any, request: EnrichmentRequest, max_length: int = 200) -> Dict[str, Any]:
+        """Turn a model answer into an enrichment dict, with defaults for anything missing"""
+        content = request.content
+        # Fallback to simple summary if OpenAI fails
+        enrichment = {
+            "summary": content[:max_length] + "..." if len(content) > max_length else content,
+            "industry": Industry.OTHER,
+            "keywords": list(DEFAULT_KEYWORDS),
+            "author": None,
+            "date": None
+        }
+        if not isinstance(result, dict) or not result:
+            return enrichment
+
+        summary = result.get("summary")
+        if isinstance(summary, str) and summary.strip():
+            enrichment["summary"] = summary.strip()
+
+        if request.want_industry:
+            enrichment["industry"] = self._map_industry(
+                result.get("industry"))
+        enrichment["keywords"] = self._normalize_keywords(
+            result.get("keywords"))
+
+        # Extract author
+        author = result.get("author") if request.want_author else None
+        if isinstance(author, str) and author.strip() and author != "null":
+            enrichment["author"] = author.strip()
+
+        # Extract and parse date
+        date_str = result.get("date") if request.want_date else None
+        if date_str and date_str != "null":
+            try:
+                # Parse the date and ensure it's timezone-aware (UTC)
+                enrichment["date"] = datetime.strptime(
+                    date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            except (TypeError, ValueError):
+                logger.warning(f"Could not parse date: {date_str}")
+
+        return enrichment
+
+    def _map_industry(self, label: Optional[str]) -> str:
+        """Map the model's industry label to our Industry enum values"""
+        if not isinstance(label, str):
             return Industry.OTHER
+        label = label.strip().lower()
+        industry = INDUSTRY_MAPPING.get(label)
+        if industry is not None:
+            return industry
+        return next((value for pattern, value in _INDUSTRY_RULES if pattern.search(label)), Industry.OTHER)
 
-    def _generate_embedding(self, text: str) -> List[float]:
+    def _generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding vector for the article text using OpenAI"""
-        try:
-            response = self.openai_client.embeddings.create(
-                model=settings.OPENAI_EMBEDDING_MODEL,
-                # OpenAI has a token limit, truncate if necessary
-                input=text[:8000]
-            )
+        return self._generate_embeddings_bulk([text])[0]
 
-            return response.data[0].embedding
+    def _generate_embeddings_bulk(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for many texts, sending cache misses to OpenAI in batches
 
-        except Exception as e:
-            logger.error(f"Error generating embedding: {e}")
-            # Return zero vector as fallback
-            return [0.0] * settings.OPENAI_EMBEDDING_DIMENSIONS
+        Returns:
+            A (len(texts), dimensions) float32 matrix with one row per input
+            text, in order. Rows for a batch that fails stay zero so the
+            remaining articles are unaffected.
+        """
+        model = settings.OPENAI_EMBEDDING_MODEL
+        # OpenAI has a per-input token limit, truncate at exactly that many tokens
+        encoding = _embedding_encoding(model)
+        texts = list(texts)
+        token_counts = []
+        for idx, tokens in enumerate(encoding.encode_ordinary_batch(texts)):
+            if len(tokens) > EMBEDDING_MAX_INPUT_TOKENS:
+                tokens = tokens[:EMBEDDING_MAX_INPUT_TOKENS]
+                texts[idx] = encoding.decode(tokens)
+            token_counts.append(len(tokens))
+
+        # One allocation for the whole batch; zero rows double as the fallback
+        embeddings = np.zeros(
+            (len(texts), settings.OPENAI_EMBEDDING_DIMENSIONS), dtype=np.float32)
+
+        # Each distinct uncached text is sent once, however often it repeats;
+        # copies that share a cache key are sent as the first one seen
+        missing: Dict[str, List[int]] = {}
+        missing_tokens: Dict[str, int] = {}
+        representatives: Dict[str, str] = {}
+        for idx, text in enumerate(texts):
+            cached = get_cached_embedding(text, model)
+            if cached is None:
+                text = representatives.setdefault(
+                    embedding_cache_key(text, model), text)
+                missing.setdefault(text, []).append(idx)
+                missing_tokens.setdefault(text, token_counts[idx])
+            else:
+                embeddings[idx] = cached
+
+        # Requests are network-bound, so several go out at once; results
+        # are written back here, on the calling thread
+        batches = list(self._embedding_batches(missing_tokens))
+        if len(batches) > 1:
+            results = _EMBEDDING_EXECUTOR.map(
+                lambda batch: self._request_embeddings(model, batch), batches)
+        else:
+            results = [self._request_embeddings(model, batch) for batch in batches]
+        for result in results:
+            for text, embedding in result.items():
+                set_cached_embedding(text, model, embedding)
+                embeddings[missing[text]] = embedding
 
-    def _calculate_relevance_score(self, article: Article) -> float:
+        return embeddings
+
+    def _request_embeddings(self, model: str, batch: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Embed one request's worth of texts
+
+        A request the API rejects is retried as two halves, so one bad input
+        only loses its own embedding. Any other failure loses the batch.
+        """
+        try:
+            # Raw base64 response: each vector is decoded straight into a
+            # float32 array instead of thousands of Python floats
+            response = self.openai_client.embeddings.with_raw_response.create(
+                model=model,
+                input=batch,
+                encoding_format="base64"
+            )
+            data = orjson.loads(response.content)["data"]
+        except BadRequestError as e:
+            if len(batch) == 1:
+                logger.error(f"Error generating embeddings: {e}")
+                return {}
+            logger.warning(
+                f"Embedding request for {len(batch)} texts rejected, splitting: {e}")
+            middle = len(batch) // 2
+            return {**self._request_embeddings(model, batch[:middle]),
+                    **self._request_embeddings(model, batch[middle:])}
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            return {}
+
+        # float32 halves memory against float64 and binds to the halfvec column
+        return {batch[item["index"]]: np.frombuffer(base64.b64decode(item["embedding"]), dtype=np.float32)
+                for item in data}
+
+    def _embedding_batches(self, token_counts: Dict[str, int]) -> Iterator[List[str]]:
+        """Greedily pack texts into requests bounded by input count and total tokens"""
+        batch: List[str] = []
+        batch_tokens = 0
+        for text, tokens in token_counts.items():
+            if batch and (len(batch) == EMBEDDING_BATCH_SIZE
+                          or batch_tokens + tokens > EMBEDDING_MAX_REQUEST_TOKENS):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    def _calculate_relevance_score(self, article: Article, now: Optional[datetime] = None) -> float:
         """
         Calculate a relevance score for the article based solely on recency.
 
@@ -233,27 +1024,63 @@ class ArticleProcessor:
         - A fresh article (0 days) has recency_score 1.0
         - A 1-day old article has recency_score ~0.6
         - A 3-day old article has recency_score ~0.22
+
+        Callers scoring many articles pass one timezone-aware now for all of them.
         """
-        # Base recency score
-        recency_score = 0.0
-        if article.published_at:
-            # Ensure both dates are timezone-aware for comparison
-            now = datetime.now(timezone.utc)
-            pub_date = article.published_at
-            if pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=timezone.utc)
+        return article.recency_score_at(now or datetime.now(timezone.utc))
 
-            days_old = (now - pub_date).days
-            decay_factor = 0.5  # Controls how quickly relevance decays with age
-            recency_score = math.exp(-decay_factor * max(0, days_old))
+    def _calculate_recency_scores_vec(self, articles: List[Article]) -> np.ndarray:
+        """
+        Vectorized _calculate_relevance_score for a whole batch of articles
 
-        # Return just the recency score without industry weighting
-        return recency_score
+        Returns:
+            Array of recency scores in the same order as the input articles,
+            0.0 for articles without a publication date
+        """
+        # Naive publication dates are stored as UTC
+        pub_timestamps = np.array([
+            (article.published_at if article.published_at.tzinfo
+             else article.published_at.replace(tzinfo=timezone.utc)).timestamp()
+            if article.published_at else np.nan
+            for article in articles
+        ], dtype=np.float64)
+
+        # Whole days elapsed, matching timedelta.days in the scalar version
+        days_old = np.floor(
+            (datetime.now(timezone.utc).timestamp() - pub_timestamps) / 86400.0)
+        scores = np.exp(-RECENCY_DECAY * np.clip(days_old, 0, None))
+        return np.where(np.isnan(days_old), 0.0, scores)
+
+    def _persona_block(self, persona: dict) -> str:
+        """Describe a persona for the scoring prompts"""
+        # Extract persona attributes
+        recipient_name = persona.get("recipientName", "")
+        job_title = persona.get("jobTitle", "")
+        company = persona.get("company", "")
+        conversation_context = persona.get("conversationContext", "")
+        personality_traits = persona.get("personalityTraits", "")
+
+        # Create a combined description of the persona
+        persona_description = f"Recipient: {recipient_name}\n"
+        if job_title:
+            persona_description += f"Job title: {job_title}\n"
+        if company:
+            persona_description += f"Company: {company}\n"
+        if conversation_context:
+            persona_description += f"Previous conversation context: {conversation_context}\n"
+        if personality_traits:
+            persona_description += f"Personality traits: {personality_traits}\n"
+
+        return f"PERSONA INFORMATION:\n{persona_description}"
+
+    def _persona_article_text(self, article: Article) -> str:
+        """Describe an article for the scoring prompts"""
+        return f"Title: {article.title}\nSummary: {article.summary}\nIndustry: {article.industry}"
 
     def _calculate_persona_relevance_batch(self, articles: List[Article], persona: dict) -> List[float]:
         """
-        Calculate relevance scores for multiple articles using concurrent API calls.
-        This is much more efficient than making individual sequential API calls.
+        Calculate relevance scores for multiple articles using concurrent API calls,
+        each scoring a group of PERSONA_SCORING_GROUP_SIZE articles.
 
         Args:
             articles: List of articles to score
@@ -266,66 +1093,11 @@ class ArticleProcessor:
             return []
 
         try:
-            # Extract persona attributes
-            recipient_name = persona.get("recipientName", "")
-            job_title = persona.get("jobTitle", "")
-            company = persona.get("company", "")
-            conversation_context = persona.get("conversationContext", "")
-            personality_traits = persona.get("personalityTraits", "")
-
-            # Create a combined description of the persona
-            persona_description = f"Recipient: {recipient_name}\n"
-            if job_title:
-                persona_description += f"Job title: {job_title}\n"
-            if company:
-                persona_description += f"Company: {company}\n"
-            if conversation_context:
-                persona_description += f"Previous conversation context: {conversation_context}\n"
-            if personality_traits:
-                persona_description += f"Personality traits: {personality_traits}\n"
-
-            # Prepare article contents and prompts
-            prompts = []
-
-            for article in articles:
-                article_content = f"Title: {article.title}\nSummary: {article.summary}\nIndustry: {article.industry}"
-
-                prompt = f"""
-                I need to determine how relevant an article is to a specific person.
-                
-                PERSONA INFORMATION:
-                {persona_description}
-                
-                ARTICLE CONTENT:
-                {article_content}
-                
-                Consider the following aspects:
-                1. How relevant is this article to the person's job role and responsibilities?
-                2. How relevant is this article to the person's company or industry?
-                3. How well does this article connect to their previous conversation context?
-                4. Would this content be valuable to this specific person?
-                
-                Return a relevance score between 0.0 and 1.0 where:
-                - 0.0 means completely irrelevant
-                - 1.0 means extremely relevant and perfectly aligned with their interests
-                
-                Output only the numerical score (e.g., 0.87) without any explanation or additional text.
-                """
-
-                prompts.append((article, prompt))
-
-            # Calculate scores with concurrent requests
-            scores = []
             start_time = time.time()
             logger.info(f"Starting batch scoring of {len(articles)} articles")
 
-            # Process in smaller concurrent batches for better throughput
-            batch_size = 5  # Process 5 articles concurrently
-            for i in range(0, len(prompts), batch_size):
-                batch_prompts = prompts[i:i+batch_size]
-                batch_scores = self._process_prompts_concurrently(
-                    batch_prompts)
-                scores.extend(batch_scores)
+            scores = asyncio.run(
+                self._score_articles_grouped_async(articles, persona))
 
             end_time = time.time()
             logger.info(
@@ -338,120 +1110,132 @@ class ArticleProcessor:
             # Return default scores
             return [0.5] * len(articles)
 
-    def _process_prompts_concurrently(self, batch_prompts) -> List[float]:
-        """
-        Process a batch of prompts concurrently using ThreadPoolExecutor.
-
-        Args:
-            batch_prompts: List of (article, prompt) tuples
-
-        Returns:
-            List of scores
-        """
-        scores = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            for article, prompt in batch_prompts:
-                futures.append(executor.submit(
-                    self._score_single_article, prompt))
-
-            # Collect results in order
-            for future in futures:
-                try:
-                    score = future.result()
-                    scores.append(score)
-                except Exception as e:
-                    logger.error(f"Error scoring article: {e}")
-                    # Use a default score on error
-                    scores.append(0.5)
-
-        return scores
-
-    def _score_single_article(self, prompt: str) -> float:
-        """Score a single article using OpenAI API"""
-        try:
-            response = self.openai_client.chat.completions.create(
-                model=settings.OPENAI_COMPLETION_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a precision relevance scoring system that evaluates content relevance to specific personas."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.1
-            )
-
-            # Extract the score from the response
-            result = response.choices[0].message.content.strip()
-            try:
-                # Try to convert to float
-                score = float(result)
-                # Ensure it's within 0-1 range
-                score = max(0.0, min(1.0, score))
-                return score
-            except ValueError:
-                logger.warning(
-                    f"Failed to parse OpenAI relevance score: {result}")
-                return 0.5
-
-        except Exception as e:
-            logger.error(f"Error in single article scoring: {e}")
-            return 0.5
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+        wait=wait_random_exponential(min=1, max=20),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _create_score_completion_async(self, prompt: str):
+        """Request a relevance score completion, backing off on rate limits"""
+        await get_openai_rate_limiter().wait()
+        return await get_async_openai_client().chat.completions.create(
+            model=settings.OPENAI_COMPLETION_MODEL,
+            messages=[
+                {"role": "system", "content": PERSONA_SCORING_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=SINGLE_SCORE_MAX_TOKENS,
+            temperature=0.1
+        )
 
     async def _score_single_article_async(self, article_id: int, prompt: str) -> Tuple[int, float]:
         """Score a single article using OpenAI API asynchronously"""
         try:
-            response = await self.async_openai_client.chat.completions.create(
-                model=settings.OPENAI_COMPLETION_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a precision relevance scoring system that evaluates content relevance to specific personas."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.1
-            )
+            response = await self._create_score_completion_async(prompt)
+
+            if response.usage and response.usage.prompt_tokens_details:
+                logger.debug(
+                    f"Scoring prompt tokens: {response.usage.prompt_tokens}, "
+                    f"cached: {response.usage.prompt_tokens_details.cached_tokens}")
 
             # Extract the score from the response
-            result = response.choices[0].message.content.strip()
-            try:
-                # Try to convert to float
-                score = float(result)
-                # Ensure it's within 0-1 range
-                score = max(0.0, min(1.0, score))
-                return (article_id, score)
-            except ValueError:
-                logger.warning(
-                    f"Failed to parse OpenAI relevance score: {result}")
-                return (article_id, 0.5)
+            return (article_id, _parse_relevance_score(response.choices[0].message.content))
 
         except Exception as e:
             logger.error(f"Error in async article scoring: {e}")
             return (article_id, 0.5)
 
-    async def _process_prompts_async(self, batch_prompts) -> List[Tuple[int, float]]:
+    @retry(
+        retry=retry_if_exception_type(RETRYABLE_OPENAI_ERRORS),
+        wait=wait_random_exponential(min=1, max=20),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _create_group_score_completion_async(self, prompt: str, count: int):
+        """Request relevance scores for a group of articles, backing off on rate limits"""
+        await get_openai_rate_limiter().wait()
+        return await get_async_openai_client().chat.completions.create(
+            model=settings.OPENAI_COMPLETION_MODEL,
+            messages=[
+                {"role": "system", "content": PERSONA_GROUP_SCORING_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=PERSONA_SCORE_MAX_TOKENS * (count + 1),
+            temperature=0.1,
+            response_format=PERSONA_GROUP_SCORES_FORMAT
+        )
+
+    async def _score_articles_grouped_async(self, articles: List[Article], persona: dict) -> List[float]:
         """
-        Process a batch of prompts concurrently using asyncio.
+        Score articles for one persona, PERSONA_SCORING_GROUP_SIZE per request
 
-        Args:
-            batch_prompts: List of (article_id, prompt) tuples
+        The persona is sent once per group rather than once per article.
 
         Returns:
-            List of (article_id, score) tuples
+            List of relevance scores in the same order as the input articles
         """
-        tasks = []
-        for article_id, prompt in batch_prompts:
-            tasks.append(self._score_single_article_async(article_id, prompt))
+        semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+        persona_block = self._persona_block(persona)
+        groups = [articles[i:i + PERSONA_SCORING_GROUP_SIZE]
+                  for i in range(0, len(articles), PERSONA_SCORING_GROUP_SIZE)]
+        results = await asyncio.gather(*[
+            self._score_group_async(group, persona_block, semaphore) for group in groups])
+        return [score for scores in results for score in scores]
+
+    async def _score_group_async(self, articles: List[Article], persona_block: str, semaphore: asyncio.Semaphore) -> List[float]:
+        """
+        Score a group of articles with one request
+
+        Articles missing from the answer, or the whole group if the answer
+        cannot be parsed, fall back to one request each; if the request
+        itself fails they get the default score.
+        """
+        scores: Dict[int, float] = {}
+        if len(articles) > 1:
+            blocks = "\n\n".join(
+                f"### Article {number}\n{self._persona_article_text(article)}"
+                for number, article in enumerate(articles, start=1))
+            try:
+                async with semaphore:
+                    response = await self._create_group_score_completion_async(
+                        f"{persona_block}\n---ARTICLES---\n{blocks}", len(articles))
+            except Exception as e:
+                logger.error(f"Error in async group scoring: {e}")
+                return [0.5] * len(articles)
+
+            try:
+                entries = orjson.loads(
+                    response.choices[0].message.content).get("scores") or []
+                scores = {int(entry["id"]): max(0.0, min(1.0, float(entry["score"])))
+                          for entry in entries
+                          if isinstance(entry, dict) and "id" in entry and "score" in entry}
+            except Exception as e:
+                logger.warning(
+                    f"Could not parse group scores of {len(articles)} articles, scoring one at a time: {e}")
+
+        async def score_one(number: int) -> Tuple[int, float]:
+            async with semaphore:
+                return await self._score_single_article_async(
+                    number, f"{persona_block}\n---ARTICLE---\n{self._persona_article_text(articles[number - 1])}")
 
-        return await asyncio.gather(*tasks)
+        missing = [number for number in range(1, len(articles) + 1)
+                   if number not in scores]
+        scores.update(await asyncio.gather(*[score_one(number) for number in missing]))
+        return [scores[number] for number in range(1, len(articles) + 1)]
 
     def _get_cache_key(self, article_id: int, persona_hash: str) -> str:
         """Generate a cache key for article personalization scores"""
         return f"personalize:{article_id}:{persona_hash}"
 
     def _get_persona_hash(self, persona: dict) -> str:
-        """Generate a hash for the persona to use in cache keys"""
-        # Create a stable representation of the persona for hashing
-        persona_str = f"{persona.get('recipientName', '')}-{persona.get('jobTitle', '')}-{persona.get('company', '')}"
-        return str(hash(persona_str))
+        """
+        Generate a hash for the persona to use in cache keys
+
+        Covers exactly what the scoring prompt sees, and is stable across
+        processes, unlike the built-in hash() of a str.
+        """
+        return hashlib.sha256(self._persona_block(persona).encode("utf-8")).hexdigest()[:32]
 
     def calculate_combined_relevance_scores_batch(self, articles: List[Article], persona: dict = None) -> List[float]:
         """
@@ -472,12 +1256,11 @@ class ArticleProcessor:
         batch_start_time = time.time()
 
         # Calculate recency scores for all articles
-        recency_scores = [self._calculate_relevance_score(
-            article) for article in articles]
+        recency_scores = self._calculate_recency_scores_vec(articles)
 
         # If no persona provided, return just the recency scores
         if not persona:
-            return recency_scores
+            return recency_scores.tolist()
 
         # Generate persona hash for cache keys
         persona_hash = self._get_persona_hash(persona)
@@ -487,20 +1270,32 @@ class ArticleProcessor:
         articles_to_score = []
         article_ids_to_score = []
 
-        for idx, article in enumerate(articles):
-            cache_key = self._get_cache_key(article.id, persona_hash)
-            cached_score = self.redis_client.get(cache_key)
-
-            if cached_score is not None:
+        # The in-process layer answers repeats without a Redis round trip;
+        # the rest are looked up together with one MGET
+        cache_keys = [self._get_cache_key(article.id, persona_hash)
+                      for article in articles]
+        with _persona_score_cache_lock:
+            local_scores = {key: _persona_score_cache.get(key) for key in cache_keys}
+        remote = [key for key, score in local_scores.items() if score is None]
+        try:
+            remote_values = dict(zip(remote, self.redis_client.mget(remote))) if remote else {}
+        except redis.RedisError as e:
+            logger.warning(f"Persona score cache lookup failed: {e}")
+            remote_values = {}
+
+        for article, cache_key in zip(articles, cache_keys):
+            cached_score = local_scores[cache_key]
+            if cached_score is None and remote_values.get(cache_key) is not None:
                 try:
-                    cached_scores[article.id] = float(
-                        cached_score.decode('utf-8'))
-                    logger.info(
-                        f"Cache hit for article {article.id} with persona {persona_hash}")
+                    cached_score = float(remote_values[cache_key])
+                    with _persona_score_cache_lock:
+                        _persona_score_cache[cache_key] = cached_score
                 except (ValueError, TypeError):
                     # If we can't parse the cached value, score it again
-                    articles_to_score.append(article)
-                    article_ids_to_score.append(article.id)
+                    cached_score = None
+
+            if cached_score is not None:
+                cached_scores[article.id] = cached_score
             else:
                 articles_to_score.append(article)
                 article_ids_to_score.append(article.id)
@@ -513,65 +1308,24 @@ class ArticleProcessor:
 
         # Only call OpenAI if we have articles that need scoring
         if articles_to_score:
-            # Extract persona attributes for prompt generation
-            recipient_name = persona.get("recipientName", "")
-            job_title = persona.get("jobTitle", "")
-            company = persona.get("company", "")
-            conversation_context = persona.get("conversationContext", "")
-            personality_traits = persona.get("personalityTraits", "")
-
-            # Create a combined description of the persona
-            persona_description = f"Recipient: {recipient_name}\n"
-            if job_title:
-                persona_description += f"Job title: {job_title}\n"
-            if company:
-                persona_description += f"Company: {company}\n"
-            if conversation_context:
-                persona_description += f"Previous conversation context: {conversation_context}\n"
-            if personality_traits:
-                persona_description += f"Personality traits: {personality_traits}\n"
-
-            # Prepare article contents and prompts for the ones we need to score
-            prompts = []
-
-            for idx, article in enumerate(articles_to_score):
-                article_content = f"Title: {article.title}\nSummary: {article.summary}\nIndustry: {article.industry}"
-
-                prompt = f"""
-                I need to determine how relevant an article is to a specific person.
-                
-                PERSONA INFORMATION:
-                {persona_description}
-                
-                ARTICLE CONTENT:
-                {article_content}
-                
-                Consider the following aspects:
-                1. How relevant is this article to the person's job role and responsibilities?
-                2. How relevant is this article to the person's company or industry?
-                3. How well does this article connect to their previous conversation context?
-                4. Would this content be valuable to this specific person?
-                
-                Return a relevance score between 0.0 and 1.0 where:
-                - 0.0 means completely irrelevant
-                - 1.0 means extremely relevant and perfectly aligned with their interests
-                
-                Output only the numerical score (e.g., 0.87) without any explanation or additional text.
-                """
-
-                prompts.append((article_ids_to_score[idx], prompt))
-
-            # Process all prompts asynchronously in one batch
-            async_results = asyncio.run(self._process_prompts_async(prompts))
-
-            # Store results by article ID
+            # Score the misses in groups that share one copy of the persona
+            async_results = zip(article_ids_to_score, asyncio.run(
+                self._score_articles_grouped_async(articles_to_score, persona)))
+
+            # Store results by article ID and cache them (with 24-hour
+            # expiration), writing to Redis in one pipelined round trip
             new_scores = {}
+            pipe = self.redis_client.pipeline(transaction=False)
             for article_id, score in async_results:
                 new_scores[article_id] = score
-
-                # Cache the new score (with 24-hour expiration)
                 cache_key = self._get_cache_key(article_id, persona_hash)
-                self.redis_client.setex(cache_key, 86400, str(score))
+                with _persona_score_cache_lock:
+                    _persona_score_cache[cache_key] = score
+                pipe.setex(cache_key, PERSONA_SCORE_CACHE_TTL, str(score))
+            try:
+                pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Persona score cache write failed: {e}")
 
             # Combine with cached scores
             persona_scores = {**cached_scores, **new_scores}
@@ -583,19 +1337,14 @@ class ArticleProcessor:
         w1 = 0.3  # Weight for recency
         w2 = 0.7  # Weight for persona relevance
 
-        # Calculate combined scores (ordered by original article list)
-        combined_scores = []
-        for idx, article in enumerate(articles):
-            recency_score = recency_scores[idx]
-            # Get persona score by article ID
-            persona_score = persona_scores.get(article.id, 0.5)
+        # Get persona scores by article ID (ordered by original article list)
+        persona_array = np.fromiter(
+            (persona_scores.get(article.id, 0.5) for article in articles),
+            dtype=np.float64, count=len(articles))
 
-            # Calculate combined score
-            final_score = (w1 * recency_score) + (w2 * persona_score)
-
-            # Ensure score is between 0 and 1
-            final_score = max(0.0, min(1.0, final_score))
-            combined_scores.append(final_score)
+        # Calculate combined scores, ensuring each is between 0 and 1
+        combined_scores = np.clip(
+            w1 * recency_scores + w2 * persona_array, 0.0, 1.0).tolist()
 
         # Log performance metrics
         batch_end_time = time.time()
@@ -607,9 +1356,10 @@ class ArticleProcessor:
 
         return combined_scores
 
-    def _enrich_metadata(self, title: str, content: str, url: str, raw_json: dict) -> Tuple[Optional[str], Optional[datetime]]:
+    def _enrich_metadata(self, raw_json: dict, content: Optional[str] = None) -> Tuple[Optional[str], Optional[datetime]]:
         """
-        Attempt to extract missing metadata (author, publication date) from content
+        Attempt to extract missing metadata (author, publication date) from the raw source data,
+        then from a byline or date written in the start of the content
 
         Returns:
             Tuple of (author, publication_date)
@@ -617,186 +1367,53 @@ class ArticleProcessor:
         author = None
         date = None
 
-        # First try to extract from raw_json if available
         if raw_json:
-            # Different sources may have different field names
-            author_candidates = ['author', 'byline', 'creator', 'dc:creator']
-            date_candidates = ['publishedAt', 'pubDate',
-                               'date', 'dc:date', 'created', 'published']
-
-            # Try to extract author
-            for field in author_candidates:
-                if field in raw_json and raw_json[field]:
-                    author_value = raw_json[field]
-                    # Handle both string and list formats
-                    if isinstance(author_value, list) and author_value:
-                        author = author_value[0]
-                    elif isinstance(author_value, str) and author_value.strip():
-                        author = author_value.strip()
+            # Take the author from the first populated field
+            for field in AUTHOR_CANDIDATE_FIELDS:
+                if value := raw_json.get(field):
+                    # Feeds almost always give a string; some give a list
+                    if type(value) is str:
+                        author = value.strip() or None
+                    elif isinstance(value, list):
+                        author = value[0]
                     break
 
-            # Try to extract date
-            for field in date_candidates:
-                if field in raw_json and raw_json[field]:
-                    try:
-                        # Attempt to parse the date string
-                        date_str = raw_json[field]
-                        if isinstance(date_str, str):
-                            # Try common date formats
-                            for fmt in [
-                                '%Y-%m-%dT%H:%M:%SZ',  # ISO format
-                                '%Y-%m-%dT%H:%M:%S%z',  # ISO with timezone
-                                '%a, %d %b %Y %H:%M:%S %z',  # RSS format
-                                '%Y-%m-%d %H:%M:%S',  # Standard format
-                                '%Y-%m-%d',  # Simple date
-                            ]:
-                                try:
-                                    parsed_date = datetime.strptime(
-                                        date_str, fmt)
-                                    # Add timezone info if missing
-                                    if parsed_date.tzinfo is None:
-                                        parsed_date = parsed_date.replace(
-                                            tzinfo=timezone.utc)
-                                    date = parsed_date
-                                    break
-                                except ValueError:
-                                    continue
-                    except Exception as e:
-                        logger.warning(f"Error parsing date: {e}")
-
-                    if date:  # If we successfully parsed a date, break
-                        break
+            # Take the date from the first field that parses
+            for field in DATE_CANDIDATE_FIELDS:
+                if (value := raw_json.get(field)) and (date := _parse_raw_date(value)):
+                    break
 
-        # If we still don't have author or date, try to extract using OpenAI
-        if not author or not date:
-            # Only use AI extraction for substantial content
-            if len(content) > 100:
-                try:
-                    extracted_author, extracted_date = self._extract_metadata_with_ai(
-                        title, content[:2000])
-                    if not author and extracted_author:
-                        author = extracted_author
-                    if not date and extracted_date:
-                        date = extracted_date
-                except Exception as e:
-                    logger.error(f"Error extracting metadata with AI: {e}")
+        if content and (not author or not date):
+            head = content[:METADATA_SCAN_CHARS]
+            if not author:
+                byline = _BYLINE_RE.search(head)
+                author = byline.group(1) if byline else None
+            if not date:
+                date = _find_content_date(head)
 
         return author, date
 
-    def _extract_metadata_with_ai(self, title: str, content: str) -> Tuple[Optional[str], Optional[datetime]]:
-        """Use OpenAI to extract author and publication date from article content"""
-        prompt = f"""
-Extract the author and publication date from this article text:
-
-Title: {title}
-
-Content: {content}
-
-Return your answer in JSON format with these fields:
-{{
-    "author": "Author Name or null if not found",
-    "date": "YYYY-MM-DD" or null if not found
-}}
-"""
-
-        try:
-            response = self.openai_client.chat.completions.create(
-                model=settings.OPENAI_COMPLETION_MODEL,
-                messages=[
-                    {"role": "system", "content": "You extract metadata from article text."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.1,
-                response_format={"type": "json_object"}
-            )
-
-            result = json.loads(response.choices[0].message.content)
-
-            # Extract author
-            author = result.get("author") if result.get(
-                "author") != "null" else None
-
-            # Extract and parse date
-            date_str = result.get("date")
-            date = None
-            if date_str and date_str != "null":
-                try:
-                    # Parse the date and ensure it's timezone-aware (UTC)
-                    date = datetime.strptime(
-                        date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                except ValueError:
-                    logger.warning(f"Could not parse date: {date_str}")
-
-            return author, date
-
-        except Exception as e:
-            logger.error(f"Error using OpenAI to extract metadata: {e}")
-            return None, None
-
-    def _extract_keywords(self, title: str, content: str, summary: str) -> List[str]:
-        """Extract 3 relevant keywords from the article using OpenAI"""
-        try:
-            # Combine title and summary for keyword extraction
-            text = f"Title: {title}\nSummary: {summary}\nExcerpt: {content[:500]}..."
-
-            # More explicit prompt with instructions for concise keywords
-            prompt = f"""Extract exactly 3 most relevant keywords from this article.
-Return ONLY the 3 keywords separated by commas, without numbering, explanation, or additional text.
-
-IMPORTANT: Use common acronyms and shorter forms when appropriate:
-- Use "AI" instead of "Artificial Intelligence"
-- Use "ML" instead of "Machine Learning"
-- Use "NLP" instead of "Natural Language Processing"
-- Use "UI/UX" instead of "User Interface/User Experience"
-- Keep keywords brief and concise
-
-Example: "AI, Fraud Detection, Banking" instead of "Artificial Intelligence, Fraud Detection Systems, Banking Industry"
-
-Article:
-{text}"""
-
-            # Add more detailed logging
-            logger.debug(
-                f"Sending keyword extraction prompt for: {title[:30]}...")
-
-            response = self.openai_client.chat.completions.create(
-                model=settings.OPENAI_COMPLETION_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a keyword extraction tool. Output ONLY concise keywords separated by commas. Use acronyms when possible."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=50,
-                temperature=0.3  # Lower temperature for more deterministic response
-            )
-
-            keywords_text = response.choices[0].message.content.strip()
-            logger.debug(f"Raw keyword response: {keywords_text}")
-
-            # More robust parsing
-            # First, try comma separation
-            keywords = [k.strip() for k in keywords_text.split(',')]
-
-            # If we don't have enough keywords, try other separators
-            if len(keywords) < 3:
-                keywords = [k.strip() for k in keywords_text.split('\n')]
-
-            # Clean up any empty strings
-            keywords = [k for k in keywords if k]
+    def _normalize_keywords(self, keywords: Any) -> List[str]:
+        """Coerce the model's keywords into exactly 3 clean strings"""
+        if isinstance(keywords, str):
+            # Split on commas, newlines and semicolons in one pass
+            keywords = [k.strip() for k in _KW_SPLIT.split(keywords)]
+        elif isinstance(keywords, list):
+            keywords = [str(k).strip() for k in keywords]
+        else:
+            return list(DEFAULT_KEYWORDS)
 
-            # Ensure we have exactly 3 keywords
-            if len(keywords) > 3:
-                keywords = keywords[:3]
-            while len(keywords) < 3:
-                keywords.append(f"Topic {len(keywords)+1}")  # Better fallback
+        # Clean up any empty strings
+        keywords = [k for k in keywords if k]
 
-            logger.debug(f"Extracted keywords: {keywords}")
-            return keywords
+        # Ensure we have exactly 3 keywords
+        if len(keywords) > 3:
+            keywords = keywords[:3]
+        while len(keywords) < 3:
+            keywords.append(f"Topic {len(keywords)+1}")  # Better fallback
 
-        except Exception as e:
-            logger.error(f"Error extracting keywords: {e}")
-            # Return default keywords on failure
-            return ["AI", "Technology", "News"]
+        logger.debug(f"Extracted keywords: {keywords}")
+        return keywords
 
     def calculate_combined_relevance_score(self, article: Article, persona: dict = None) -> float:
         """
@@ -853,90 +1470,88 @@ Article:
 
         This provides a basic score when batch processing fails.
         """
+        return self._calculate_persona_relevance_fallback_batch([article], persona)[0]
+
+    def _calculate_persona_relevance_fallback_batch(self, articles: List[Article], persona: dict) -> List[float]:
+        """
+        _calculate_persona_relevance_fallback for many articles and one persona
+
+        The persona's terms are prepared once for the whole batch, which is
+        what pre-ranking a page of candidates needs.
+
+        Returns:
+            List of scores in the same order as the input articles
+        """
         # Extract persona attributes
         job_title = persona.get("jobTitle", "").lower()
         company = persona.get("company", "").lower()
         industry = persona.get("industry", "").lower()
 
-        # Combine article content
-        article_content = f"{article.title} {article.summary}".lower()
+        # One pass over each article finds job title, company and industry terms
+        pattern, term_categories = _persona_term_matcher(
+            job_title, company, industry)
+        all_categories = frozenset().union(*term_categories.values())
 
-        # Count simple matches
-        score = 0.0
-        matches = 0
+        scores = []
+        for article in articles:
+            matched_categories = set()
+            if pattern is not None:
+                # The matcher ignores case, so no lowered copy of the content
+                for match in pattern.finditer(f"{article.title} {article.summary}"):
+                    matched_categories |= term_categories.get(
+                        match.group(0).lower(), frozenset())
+                    # Further matches cannot raise the score
+                    if matched_categories == all_categories:
+                        break
 
-        # Check for job title keywords
-        if job_title and any(word for word in job_title.split() if len(word) > 3 and word in article_content):
-            matches += 1
+            # Count simple matches
+            matches = len(matched_categories)
 
-        # Check for company name
-        if company and company in article_content:
-            matches += 1
+            # Check for article industry
+            if article.industry and industry and article.industry == industry:
+                matches += 1
 
-        # Check for industry match
-        if industry and industry in article_content:
-            matches += 1
+            # Simple scoring based on matches; a base score for any article
+            scores.append(min(1.0, matches / 4.0) if matches > 0 else 0.3)
 
-        # Check for article industry
-        if article.industry and industry and article.industry == industry:
-            matches += 1
+        return scores
 
-        # Simple scoring based on matches
-        if matches > 0:
-            score = min(1.0, matches / 4.0)
-        else:
-            score = 0.3  # Base score for any article
-
-        return score
-
-    def _extract_job_role_terms(self, job_title: str) -> list:
-        """Extract relevant terms from a job title for matching."""
-        # Common job title components
-        common_roles = [
-            "manager", "director", "executive", "analyst", "specialist",
-            "engineer", "developer", "architect", "consultant", "advisor",
-            "officer", "lead", "head", "chief", "vp", "president", "ceo", "cto", "cio"
-        ]
-
-        # Common industries/departments
-        common_departments = [
-            "sales", "marketing", "product", "engineering", "development", "finance",
-            "hr", "operations", "research", "strategy", "technology", "it", "security",
-            "data", "analytics", "customer", "support", "service", "business", "legal"
-        ]
-
-        job_title_lower = job_title.lower()
-        terms = job_title_lower.split()
-
-        # Add original terms
-        result = [term for term in terms if len(term) > 2]
-
-        # Add matched roles and departments
-        for role in common_roles:
-            if role in job_title_lower and role not in result:
-                result.append(role)
-
-        for dept in common_departments:
-            if dept in job_title_lower and dept not in result:
-                result.append(dept)
-
-        return result
-
-    def _infer_industry_from_text(self, text: str) -> str:
-        """Infer industry from text (job title, company, etc.)"""
-        text_lower = text.lower()
-
-        industry_keywords = {
-            "bfsi": ["bank", "finance", "insurance", "wealth", "investment", "trading", "fintech"],
-            "retail": ["retail", "ecommerce", "shop", "store", "consumer", "merchandise"],
-            "technology": ["tech", "software", "hardware", "cloud", "saas", "digital", "computer", "it"],
-            "healthcare": ["health", "medical", "pharma", "biotech", "hospital", "clinic", "patient"],
-            "other": []
-        }
+    def _persona_embedding_text(self, persona: dict) -> str:
+        """The parts of a persona that say what they care about, for embedding"""
+        return "\n".join(
+            str(persona[field]) for field in ("jobTitle", "company", "industry", "conversationContext")
+            if persona.get(field))
 
-        for industry, keywords in industry_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return industry
+    def _calculate_persona_similarity_batch(self, articles: List[Article], persona: dict) -> List[float]:
+        """
+        Pre-rank articles for a persona by embedding similarity
 
-        return "other"
+        The persona is embedded once (through the embedding cache) and
+        compared against the stored article embeddings with one matrix
+        product. Falls back to keyword matching if any article has no
+        embedding or the persona cannot be embedded.
+
+        Returns:
+            List of scores in the same order as the input articles
+        """
+        persona_text = self._persona_embedding_text(persona)
+        if not articles or not persona_text or any(article.embedding is None for article in articles):
+            return self._calculate_persona_relevance_fallback_batch(articles, persona)
+
+        persona_vec = self._generate_embedding(persona_text)
+        persona_norm = np.linalg.norm(persona_vec)
+        if not persona_norm:
+            return self._calculate_persona_relevance_fallback_batch(articles, persona)
+
+        matrix = np.vstack([_embedding_array(article.embedding) for article in articles])
+        norms = np.linalg.norm(matrix, axis=1) * persona_norm
+        similarities = np.divide(matrix @ persona_vec, norms,
+                                 out=np.zeros(len(articles), dtype=np.float32),
+                                 where=norms > 0)
+        return similarities.tolist()
+
+    def _industry_candidates(self, text: str) -> List[str]:
+        """Every industry with a keyword in the text, in INDUSTRY_KEYWORDS order"""
+        found = {match.lastgroup for match in _INDUSTRY_TEXT_RE.finditer(text)}
+        # Ordered by INDUSTRY_KEYWORDS rather than position in the text
+        return [industry for industry in INDUSTRY_KEYWORDS if industry.value in found]
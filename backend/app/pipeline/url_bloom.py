@@ -0,0 +1,110 @@
+import hashlib
+import logging
+import math
+import uuid
+from typing import Iterable, List, Set
+
+import redis
+from sqlalchemy.orm import Session
+
+from app.core.redis import get_redis_client
+from app.db.models import Article, normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Bloom filter over every stored article's normalized URL, kept as a Redis
+# bitmap so all workers share it. A miss means the URL is certainly new and
+# the database lookup can be skipped; a hit still has to be confirmed there.
+URL_BLOOM_KEY = "bloom:article_urls"
+URL_BLOOM_CAPACITY = 1_000_000
+URL_BLOOM_ERROR_RATE = 0.001
+
+# Standard sizing: m = -n ln(p) / ln(2)^2 bits and k = (m / n) ln(2) hashes
+URL_BLOOM_BITS = math.ceil(
+    -URL_BLOOM_CAPACITY * math.log(URL_BLOOM_ERROR_RATE) / math.log(2) ** 2)
+URL_BLOOM_HASHES = round(URL_BLOOM_BITS / URL_BLOOM_CAPACITY * math.log(2))
+
+# Rows read per round trip when building the filter from the database
+URL_BLOOM_WARM_CHUNK = 10_000
+
+
+def _bit_offsets(url: str) -> List[int]:
+    """Bit positions for a URL, derived from one SHA-256 by double hashing"""
+    digest = hashlib.sha256(url.encode("utf-8")).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:16], "big") | 1
+    return [(h1 + i * h2) % URL_BLOOM_BITS for i in range(URL_BLOOM_HASHES)]
+
+
+def _set_bits(pipe, key: str, urls: Iterable[str]) -> None:
+    for url in urls:
+        for offset in _bit_offsets(url):
+            pipe.setbit(key, offset, 1)
+
+
+def ensure_url_bloom(db: Session) -> bool:
+    """
+    Make sure the filter exists, building it from the article table if not
+
+    The filter is filled under a temporary key and renamed into place, so
+    other workers never see a half-built filter. Returns False if Redis is
+    unavailable and callers should fall back to the database alone.
+    """
+    client = get_redis_client()
+    try:
+        if client.exists(URL_BLOOM_KEY):
+            return True
+
+        logger.info("Building article URL Bloom filter from the database")
+        building_key = f"{URL_BLOOM_KEY}:building:{uuid.uuid4().hex}"
+        pipe = client.pipeline(transaction=False)
+        # Allocate the whole bitmap up front so an empty table still yields a filter
+        pipe.setbit(building_key, URL_BLOOM_BITS - 1, 0)
+        for count, (url,) in enumerate(
+                db.query(Article.url).yield_per(URL_BLOOM_WARM_CHUNK), start=1):
+            _set_bits(pipe, building_key, [normalize_url(url)])
+            if count % URL_BLOOM_WARM_CHUNK == 0:
+                pipe.execute()
+        pipe.execute()
+        client.rename(building_key, URL_BLOOM_KEY)
+        return True
+    except redis.RedisError as e:
+        logger.warning("Article URL Bloom filter unavailable: %s", e)
+        return False
+
+
+def url_bloom_contains(urls: Iterable[str]) -> Set[str]:
+    """
+    Return the normalized URLs that may already be stored
+
+    On a Redis error every URL is reported as possibly stored.
+    """
+    urls = list(urls)
+    pipe = get_redis_client().pipeline(transaction=False)
+    for url in urls:
+        for offset in _bit_offsets(url):
+            pipe.getbit(URL_BLOOM_KEY, offset)
+
+    try:
+        bits = pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Article URL Bloom filter lookup failed: %s", e)
+        return set(urls)
+
+    return {
+        url for i, url in enumerate(urls)
+        if all(bits[i * URL_BLOOM_HASHES:(i + 1) * URL_BLOOM_HASHES])
+    }
+
+
+def url_bloom_add(urls: Iterable[str]) -> None:
+    """Record normalized URLs as stored; a no-op until the filter has been built"""
+    client = get_redis_client()
+    try:
+        if not client.exists(URL_BLOOM_KEY):
+            return
+        pipe = client.pipeline(transaction=False)
+        _set_bits(pipe, URL_BLOOM_KEY, urls)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Article URL Bloom filter update failed: %s", e)
@@ -1,3 +1,4 @@
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import logging
@@ -190,18 +191,11 @@ def update_all_relevance_scores():
     try:
         logger.info("Starting update of all article relevance scores")
 
-        # Get all articles
-        articles = db.query(Article).all()
-        count = 0
-
-        # Create processor
-        processor = ArticleProcessor(db)
-
-        for article in articles:
-            # Calculate new relevance score
-            article.relevance_score = processor._calculate_relevance_score(
-                article)
-            count += 1
+        # The score is computed by the database in one UPDATE, so no rows
+        # are loaded into Python at all
+        count = db.execute(
+            update(Article).values(relevance_score=Article.recency_score)
+        ).rowcount
 
         # Commit all changes
         db.commit()
@@ -13,7 +13,8 @@ CREATE TABLE IF NOT EXISTS source (
     url VARCHAR(2048),
     description TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT unique_source_name_type UNIQUE (name, type)
 );
 
 -- Article table
@@ -22,6 +23,7 @@ CREATE TABLE IF NOT EXISTS article (
     source_id INTEGER REFERENCES source(id) NOT NULL,
     title VARCHAR(512) NOT NULL,
     url VARCHAR(2048) NOT NULL,
+    url_normalized VARCHAR(2048),
     author VARCHAR(255),
     published_at TIMESTAMP WITH TIME ZONE,
     content TEXT,
@@ -29,11 +31,12 @@ CREATE TABLE IF NOT EXISTS article (
     image_url VARCHAR(2048),
     industry VARCHAR(50),
     relevance_score FLOAT DEFAULT 0.0,
-    embedding VECTOR(3072),
+    embedding HALFVEC(3072),
     raw_json JSONB,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    CONSTRAINT unique_article_url UNIQUE (url)
+    CONSTRAINT unique_article_url UNIQUE (url),
+    CONSTRAINT unique_article_url_normalized UNIQUE (url_normalized)
 );
 
 -- Create indexes